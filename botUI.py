@@ -6,10 +6,9 @@ This module will be removed in a future version.
 """
 
 import sys
-import asyncio
 from loguru import logger
 from config import load_config
-from main import TradingBotUI
+from main import TradingBotUI, setup_logging, run
 from trading_engine import TradingEngine
 from mexc_client import MexcClient
 
@@ -20,12 +19,14 @@ logger.warning(
 
 async def main():
     """Wrapper for backward compatibility"""
+    setup_logging()
+    
     # Parse legacy arguments
     headless_mode = '--headless' in sys.argv
     
     try:
-        # Load config
-        config = load_config()
+        # Load config (copied, since headless is overridden below)
+        config = load_config().model_copy(deep=True)
         config.headless = headless_mode
         
         # Initialize components
@@ -33,8 +34,9 @@ async def main():
         engine = TradingEngine(config, client)
         ui = TradingBotUI(engine, headless_mode)
         
-        # Start UI
-        await ui.start()
+        # Start UI inside one long-lived API session shared by every request
+        async with client:
+            await ui.start()
         
     except KeyboardInterrupt:
         logger.info("Shutting down...")
@@ -43,4 +45,4 @@ async def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
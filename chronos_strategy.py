@@ -1,20 +1,31 @@
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
+import time
 import numpy as np
 from loguru import logger
 from config import load_config, BotConfig
-import logging_config
+
+__all__ = ['ChronosTradingStrategy']
+
+def _trend_stats(first: float, last: float, periods: int) -> Tuple[float, float]:
+    """Return (mean price change, trend strength) for a window of prices.
+    
+    The consecutive differences telescope, so the mean change only depends on
+    the first and last price of the window.
+    """
+    mean_change = (last - first) / (periods - 1)
+    return mean_change, abs(mean_change)
 
 class ChronosTradingStrategy:
     """Advanced trading strategy using trend analysis"""
     
     def __init__(self, config: Optional[BotConfig] = None):
         self.config = config or load_config()
-        self.historical_prices: List[float] = []
         self.last_signal = "NEUTRAL"
         self.last_confidence = 0.0
         self.last_prediction_time = None
-        self._last_update = None
+        self.last_prediction_monotonic: Optional[float] = None
+        self._last_update_ns: Optional[int] = None  # time.monotonic_ns() of the last price update
         self._price_predictions = []
         
         # Initialize strategy parameters from config
@@ -28,40 +39,108 @@ class ChronosTradingStrategy:
         self.feature_columns = ai_config.feature_columns
         self.target_column = ai_config.target_column
         
+        # Fixed-size ring buffer of recent prices (oldest entries are overwritten)
+        self._buf = np.empty(self.max_historical_data, dtype=np.float64)
+        self._head = 0
+        self._size = 0
+        self._scratch = np.empty_like(self._buf)  # reused to unwrap windows that cross the buffer end
+        
+        # Bumped on every data update; predictions are memoized against it
+        self._tick = 0
+        self._prediction_cache: Optional[Dict[str, Any]] = None
+        self._prediction_cache_tick = -1
+        
+    @property
+    def historical_prices(self) -> np.ndarray:
+        """Stored prices, oldest first"""
+        return self._recent(self._size)
+        
+    def _recent(self, k: int) -> np.ndarray:
+        """Return the last k prices, oldest first (a view, valid until the next update or call)"""
+        k = min(k, self._size)
+        start = (self._head - k) % len(self._buf)
+        if start + k <= len(self._buf):
+            return self._buf[start:start + k]
+        return np.concatenate((self._buf[start:], self._buf[:self._head]), out=self._scratch[:k])
+        
     def update_data(self, price: float) -> None:
         """Update strategy with new price data"""
         try:
             if price is not None and price > 0:
-                self.historical_prices.append(price)
-                
-                # Keep only the most recent data points
-                if len(self.historical_prices) > self.max_historical_data:
-                    self.historical_prices = self.historical_prices[-self.max_historical_data:]
+                self._buf[self._head] = price
+                self._head = (self._head + 1) % len(self._buf)
+                self._size = min(self._size + 1, len(self._buf))
+                self._tick += 1
                 
                 # Update last update time
-                self._last_update = datetime.now()
+                self._last_update_ns = time.monotonic_ns()
         except Exception as e:
             logger.error(f"Error updating price data: {e}")
-    
+
+    def extend_data(self, prices: List[float]) -> None:
+        """Update strategy with a batch of price data (e.g. historical closes)"""
+        try:
+            values = np.asarray(prices, dtype=np.float64)
+            values = values[values > 0]
+            count = len(values)
+            if count == 0:
+                return
+
+            size = len(self._buf)
+            if count >= size:
+                # Batch fills the whole buffer; keep only its newest prices
+                self._buf[:] = values[-size:]
+                self._head = 0
+            else:
+                end = self._head + count
+                if end <= size:
+                    self._buf[self._head:end] = values
+                else:
+                    split = size - self._head
+                    self._buf[self._head:] = values[:split]
+                    self._buf[:count - split] = values[split:]
+                self._head = end % size
+            self._size = min(self._size + count, size)
+            self._tick += 1
+
+            # Update last update time
+            self._last_update_ns = time.monotonic_ns()
+        except Exception as e:
+            logger.error(f"Error updating price data: {e}")
+
     def predict(self) -> Dict[str, Any]:
+        """Generate predictions using trend analysis, reusing the result until new data arrives"""
+        if self._prediction_cache_tick != self._tick:
+            self._prediction_cache = self._compute_prediction()
+            self._prediction_cache_tick = self._tick
+        return self._prediction_cache
+    
+    def _compute_prediction(self) -> Dict[str, Any]:
         """Generate predictions using trend analysis"""
         try:
-            with logging_config.ai_context():
-                if len(self.historical_prices) < self.lookback_periods:
-                    logger.warning(f"Insufficient data: {len(self.historical_prices)}/{self.lookback_periods}")
-                    return {
-                        'direction': 'NEUTRAL',
-                        'confidence': 0.0,
-                        'prediction': None,
-                        'error': 'Insufficient data'
-                    }
+            # Bind hot attributes to locals once per call
+            buf, head, lookback = self._buf, self._head, self.lookback_periods
+            min_trend_strength = self.min_trend_strength
+            
+            if self._size < lookback:
+                # Imported lazily: only this warning needs the AI log context
+                import logging_config
+                with logging_config.ai_context():
+                    logger.warning(f"Insufficient data: {self._size}/{lookback}")
+                return {
+                    'direction': 'NEUTRAL',
+                    'confidence': 0.0,
+                    'prediction': None,
+                    'error': 'Insufficient data'
+                }
             
-            # Calculate trend
-            recent_prices = self.historical_prices[-self.lookback_periods:]
-            price_changes = np.diff(recent_prices)
-            trend_strength = np.abs(np.mean(price_changes))
+            # Calculate trend (item() yields Python floats, so no NumPy scalar math below)
+            size = len(buf)
+            first_price = buf.item((head - lookback) % size)
+            current_price = buf.item((head - 1) % size)
+            mean_change, trend_strength = _trend_stats(first_price, current_price, lookback)
             
-            if trend_strength < self.min_trend_strength:
+            if trend_strength < min_trend_strength:
                 return {
                     'direction': 'NEUTRAL',
                     'confidence': 0.0,
@@ -70,17 +149,17 @@ class ChronosTradingStrategy:
                 }
             
             # Determine direction
-            trend_direction = 'UP' if np.mean(price_changes) > 0 else 'DOWN'
-            confidence = min(trend_strength / self.min_trend_strength, 1.0)
+            trend_direction = 'UP' if mean_change > 0 else 'DOWN'
+            confidence = min(trend_strength / min_trend_strength, 1.0)
             
             # Calculate prediction
-            current_price = self.historical_prices[-1]
-            predicted_change = np.mean(price_changes) * self.prediction_length
+            predicted_change = mean_change * self.prediction_length
             predicted_price = current_price + predicted_change
             
             self.last_signal = trend_direction
             self.last_confidence = confidence
             self.last_prediction_time = datetime.now()
+            self.last_prediction_monotonic = time.monotonic()
             
             return {
                 'direction': trend_direction,
@@ -100,11 +179,40 @@ class ChronosTradingStrategy:
             logger.error(f"AI Prediction error: {e}\nFull details: {error_info}")
             return error_info
     
+    def generate_signal(self) -> str:
+        """Generate trading signal based on trend analysis"""
+        if self._size < 2:
+            return "NEUTRAL"
+            
+        prediction = self.predict()
+        confidence = prediction['confidence']
+        direction = prediction['direction']
+        
+        if confidence < self.confidence_threshold:
+            return "NEUTRAL"
+            
+        if direction == "UP":
+            return "BUY"
+        elif direction == "DOWN":
+            return "SELL"
+        
+        return "NEUTRAL"
+    
+    def get_prediction_info(self) -> Dict[str, Any]:
+        """Get the latest prediction information"""
+        prediction = self.predict()
+        return {
+            'direction': prediction['direction'],
+            'confidence': prediction['confidence'],
+            'current_price': self._buf.item((self._head - 1) % len(self._buf)) if self._size else None,
+            'predicted_price': prediction['prediction']
+        }
+    
     def get_last_prediction(self) -> Dict[str, Any]:
         """Get the last prediction"""
         try:
-            if self.last_prediction_time is None or \
-               (datetime.now() - self.last_prediction_time).total_seconds() > self.config.ai_config.update_interval:
+            if self.last_prediction_monotonic is None or \
+               time.monotonic() - self.last_prediction_monotonic > self.config.ai_config.update_interval:
                 return self.predict()
             
             return {
@@ -1,16 +1,18 @@
 import os
-from pydantic import BaseModel, Field
+import functools
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Tuple
-from dotenv import load_dotenv
 
-load_dotenv()
+class _ConfigModel(BaseModel):
+    """Base for config models: unknown fields are rejected instead of silently dropped"""
+    model_config = ConfigDict(extra='forbid')
 
-class MexcCredentials(BaseModel):
+class MexcCredentials(_ConfigModel):
     api_key: str = Field(..., description="MEXC API Key")
     secret_key: str = Field(..., description="MEXC Secret Key")
     passphrase: Optional[str] = Field(None, description="MEXC Passphrase if required")
 
-class TradingParams(BaseModel):
+class TradingParams(_ConfigModel):
     symbol: str = Field(..., description="Trading pair symbol (e.g., BTC_USDT)")
     timeframe: str = Field(default="5m", description="Trading timeframe")
     leverage: int = Field(default=1, ge=1, le=20, description="Trading leverage")
@@ -20,7 +22,7 @@ class TradingParams(BaseModel):
     stop_loss_pct: float = Field(default=2.0, ge=0.1, le=50.0, description="Stop loss percentage")
     take_profit_pct: float = Field(default=3.0, ge=0.1, le=100.0, description="Take profit percentage")
 
-class TimeWindow(BaseModel):
+class TimeWindow(_ConfigModel):
     start: str = Field(..., description="Trading window start time (HH:MM)")
     end: str = Field(..., description="Trading window end time (HH:MM)")
     enabled: bool = Field(default=True, description="Whether the time window is active")
@@ -33,8 +35,20 @@ class TimeWindow(BaseModel):
     @property
     def end_time(self) -> str:
         return self.end.strip('#') if self.end else "23:59"
+    
+    @functools.cached_property
+    def start_minute(self) -> int:
+        """Window start as minutes after midnight, parsed once"""
+        hours, minutes = self.start_time.split(":")
+        return int(hours) * 60 + int(minutes)
+    
+    @functools.cached_property
+    def end_minute(self) -> int:
+        """Window end as minutes after midnight, parsed once"""
+        hours, minutes = self.end_time.split(":")
+        return int(hours) * 60 + int(minutes)
 
-class AIConfig(BaseModel):
+class AIConfig(_ConfigModel):
     model_path: str = Field(default="amazon/chronos-t5-small", description="Path to the AI model")
     prediction_length: int = Field(default=12, description="Number of periods to predict")
     lookback_periods: int = Field(default=24, description="Number of periods to look back")
@@ -46,87 +60,123 @@ class AIConfig(BaseModel):
     target_column: str = Field(default="close", description="Target column for prediction")
     timeframe: str = Field(default="5m", description="Trading timeframe")
 
-class RiskConfig(BaseModel):
+class RiskConfig(_ConfigModel):
     max_drawdown_pct: float = Field(default=15.0, ge=1.0, le=50.0, description="Maximum drawdown percentage allowed")
     risk_per_trade_pct: float = Field(default=1.0, ge=0.1, le=5.0, description="Risk percentage per trade")
     position_sizing: str = Field(default="dynamic", description="Position sizing strategy")
 
-class BotConfig(BaseModel):
+class BotConfig(_ConfigModel):
     credentials: MexcCredentials
     trading_params: TradingParams
     trading_windows: List[TimeWindow] = Field(default=[], description="Active trading time windows")
     ai_config: AIConfig = Field(default_factory=AIConfig, description="AI trading configuration")
     risk_config: RiskConfig = Field(default_factory=RiskConfig, description="Risk management configuration")
     log_level: str = Field(default="INFO", description="Logging level")
+    dry_run: bool = Field(default=True, description="Simulate orders instead of sending them")
     headless: bool = Field(default=False, description="Run in headless mode without curses UI")
     rate_limit_requests_per_second: float = Field(default=10.0, description="Rate limiting")
     track_metrics: bool = Field(default=True, description="Enable performance tracking")
     save_predictions: bool = Field(default=True, description="Save model predictions")
-    
-    class Config:
-        env_file = ".env"
 
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+def _to_bool(value: str) -> bool:
+    """Interpret an environment string as a boolean flag"""
+    return value.strip().lower() in _TRUE_VALUES
+
+def _env_bool(env, name: str, default: bool) -> bool:
+    """Read a boolean flag from an environment snapshot"""
+    value = env.get(name)
+    if value is None:
+        return default
+    return _to_bool(value)
+
+# (environment variable, field name, type conversion, default) for each trading parameter
+_TRADING_PARAMS_SCHEMA = [
+    ("TRADING_SYMBOL", "symbol", str, "BTC_USDT"),
+    ("TIMEFRAME", "timeframe", str, "5m"),
+    ("LEVERAGE", "leverage", int, "1"),
+    ("DRY_RUN", "dry_run", _to_bool, "true"),
+    ("TRADING_QUANTITY", "trade_amount", float, "10.0"),
+    ("MAX_ORDERS_PER_DAY", "max_orders_per_day", int, "10"),
+    ("STOP_LOSS_PERCENTAGE", "stop_loss_pct", float, "2.0"),
+    ("TAKE_PROFIT_PERCENTAGE", "take_profit_pct", float, "3.0"),
+]
+
+# (environment variable, field name, type conversion, default) for each AI setting
+_AI_CONFIG_SCHEMA = [
+    ("MODEL_PATH", "model_path", str, "amazon/chronos-t5-small"),
+    ("PREDICTION_LENGTH", "prediction_length", int, "12"),
+    ("LOOKBACK_PERIODS", "lookback_periods", int, "24"),
+    ("MAX_HISTORICAL_DATA", "max_historical_data", int, "1000"),
+    ("CONFIDENCE_THRESHOLD", "confidence_threshold", float, "0.65"),
+    ("MIN_TREND_STRENGTH", "min_trend_strength", float, "0.4"),
+    ("UPDATE_INTERVAL", "update_interval", int, "300"),
+    ("FEATURE_COLUMNS", "feature_columns", lambda value: value.split(","), "close,volume,high,low"),
+    ("TARGET_COLUMN", "target_column", str, "close"),
+    ("TIMEFRAME", "timeframe", str, "5m"),
+]
+
+# (environment variable, field name, type conversion, default) for each risk setting
+_RISK_CONFIG_SCHEMA = [
+    ("MAX_DRAWDOWN_PCT", "max_drawdown_pct", float, "15.0"),
+    ("RISK_PER_TRADE_PCT", "risk_per_trade_pct", float, "1.0"),
+    ("POSITION_SIZING", "position_sizing", str, "dynamic"),
+]
+
+def _parse_env(env, schema) -> dict:
+    """Read and convert every variable in a schema from an environment snapshot"""
+    return {field: cast(env.get(name, default)) for name, field, cast, default in schema}
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> BotConfig:
-    """Load bot configuration from environment variables"""
+    """Load bot configuration from environment variables (cached; see reload_config)"""
+    from dotenv import load_dotenv
     load_dotenv()
+    env = os.environ
     
     # Load credentials
-    credentials = MexcCredentials(
-        api_key=os.getenv("MEXC_API_KEY", ""),
-        secret_key=os.getenv("MEXC_SECRET_KEY", ""),
-        passphrase=os.getenv("MEXC_PASSPHRASE", None)
+    credentials = dict(
+        api_key=env.get("MEXC_API_KEY", ""),
+        secret_key=env.get("MEXC_SECRET_KEY", ""),
+        passphrase=env.get("MEXC_PASSPHRASE", None)
     )
     
     # Load trading params
-    trading_params = TradingParams(
-        symbol=os.getenv("TRADING_SYMBOL", "BTC_USDT"),
-        timeframe=os.getenv("TIMEFRAME", "5m"),
-        leverage=int(os.getenv("LEVERAGE", "1")),
-        dry_run=os.getenv("DRY_RUN", "true").lower() == "true",
-        trade_amount=float(os.getenv("TRADING_QUANTITY", "10.0")),
-        max_orders_per_day=int(os.getenv("MAX_ORDERS_PER_DAY", "10")),
-        stop_loss_pct=float(os.getenv("STOP_LOSS_PERCENTAGE", "2.0")),
-        take_profit_pct=float(os.getenv("TAKE_PROFIT_PERCENTAGE", "3.0"))
-    )
+    trading_params = _parse_env(env, _TRADING_PARAMS_SCHEMA)
     
     # Load AI config
-    ai_config = AIConfig(
-        model_path=os.getenv("MODEL_PATH", "amazon/chronos-t5-small"),
-        prediction_length=int(os.getenv("PREDICTION_LENGTH", "12")),
-        lookback_periods=int(os.getenv("LOOKBACK_PERIODS", "24")),
-        confidence_threshold=float(os.getenv("CONFIDENCE_THRESHOLD", "0.65")),
-        min_trend_strength=float(os.getenv("MIN_TREND_STRENGTH", "0.4")),
-        update_interval=int(os.getenv("UPDATE_INTERVAL", "300")),
-        feature_columns=os.getenv("FEATURE_COLUMNS", "close,volume,high,low").split(","),
-        target_column=os.getenv("TARGET_COLUMN", "close"),
-        timeframe=os.getenv("TIMEFRAME", "5m")
-    )
+    ai_config = _parse_env(env, _AI_CONFIG_SCHEMA)
     
     # Load risk config
-    risk_config = RiskConfig(
-        max_drawdown_pct=float(os.getenv("MAX_DRAWDOWN_PCT", "15.0")),
-        risk_per_trade_pct=float(os.getenv("RISK_PER_TRADE_PCT", "1.0")),
-        position_sizing=os.getenv("POSITION_SIZING", "dynamic")
-    )
+    risk_config = _parse_env(env, _RISK_CONFIG_SCHEMA)
     
     # Load trading windows
     trading_windows = []
-    window_str = os.getenv("TRADING_WINDOWS", "")
+    window_str = env.get("TRADING_WINDOWS", "")
     if window_str:
         for window in window_str.split(","):
             if "/" in window:
                 start, end = window.split("/")
-                trading_windows.append(TimeWindow(
+                trading_windows.append(dict(
                     start=start.strip(),
                     end=end.strip(),
                     enabled=True
                 ))
                 
-    return BotConfig(
+    config = dict(
         credentials=credentials,
         trading_params=trading_params,
         trading_windows=trading_windows,
         ai_config=ai_config,
-        dry_run=os.getenv("DRY_RUN", "true").lower() == "true",
-        headless=os.getenv("HEADLESS", "false").lower() == "true"
-    )
\ No newline at end of file
+        risk_config=risk_config,
+        dry_run=trading_params["dry_run"],
+        headless=_env_bool(env, "HEADLESS", False)
+    )
+    # One pydantic-core pass over the whole tree
+    return BotConfig.model_validate(config)
+
+def reload_config() -> BotConfig:
+    """Discard the cached configuration and load it again from the environment"""
+    load_config.cache_clear()
+    return load_config()
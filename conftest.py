@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""Shared pytest fixtures"""
+import pytest
+from config import load_config, BotConfig, MexcCredentials, TradingParams
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Keep a configuration cached by one test from leaking into the next"""
+    yield
+    load_config.cache_clear()
+
+@pytest.fixture
+def make_config():
+    """Factory for a minimal offline BotConfig; keyword arguments override BotConfig fields"""
+    def make(**overrides) -> BotConfig:
+        return BotConfig(
+            credentials=MexcCredentials(api_key="test_api_key", secret_key="test_secret_key"),
+            trading_params=TradingParams(symbol="BTC_USDT"),
+            **overrides
+        )
+    return make
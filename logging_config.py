@@ -1,68 +1,124 @@
 """Logging configuration for the MEXC trading bot"""
 import os
 import sys
-from datetime import datetime
+import gzip
+import shutil
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 
-# Remove any existing handlers
-logger.remove()
-
-# Create logs directory if it doesn't exist
+# Log file location (loguru creates the directory on first write)
 log_dir = "logs"
-os.makedirs(log_dir, exist_ok=True)
+# Rotation renames the current file with a date suffix, so the name itself is fixed
+log_file = os.path.join(log_dir, "MEXC.log")
+
+_configured = False
+
+# Extended tracebacks and local-variable dumps only in development: diagnose
+# output is costly to render and can expose credentials held in locals
+_DEV = os.getenv("MEXC_ENV") == "dev"
+
+# Rotated log files are gzipped here, off the logging worker thread
+_compression_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+
+def _gz_compress(path: str) -> None:
+    """Gzip a rotated log file with fast (level 1) compression and remove the original"""
+    with open(path, "rb") as src, gzip.open(f"{path}.gz", "wb", compresslevel=1) as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(path)
 
-# Set up file logging
-log_file = os.path.join(log_dir, f"MEXCL_{datetime.now().strftime('%Y-%m-%d')}.log")
+def _compress_in_background(path: str) -> None:
+    """Loguru compression hook: queue the rotated file for compression and return immediately"""
+    _compression_executor.submit(_gz_compress, path)
+
+@functools.lru_cache(maxsize=None)
+def _line_format(time_format: str, level: str, component: str) -> str:
+    """Build (once per level/component pair) a format string with both columns pre-padded"""
+    component = component.replace("{", "{{").replace("}", "}}")
+    return f"{{time:{time_format}}} | {level: <8} | {component: <10} | {{message}}\n{{exception}}"
+
+def _file_format(record) -> str:
+    """Loguru format function for the file sink"""
+    return _line_format("YYYY-MM-DD HH:mm:ss", record["level"].name, record["extra"].get("component", "SYSTEM"))
 
 # Global UI instance for log capturing
 _ui_instance = None
+_ui_handler_id = None
+
+def _add_ui_sink() -> None:
+    """Start buffering records for the UI"""
+    global _ui_handler_id
+    _ui_handler_id = logger.add(_ui_log_buffer.append, 
+                                level="INFO",
+                                format="{message}")
 
 def set_ui_instance(ui):
-    """Set the UI instance for log capturing"""
-    global _ui_instance
+    """Set the UI instance for log capturing (the UI sink only exists while one is set)"""
+    global _ui_instance, _ui_handler_id
     _ui_instance = ui
+    if not _configured:
+        return
+    if ui is not None and _ui_handler_id is None:
+        _add_ui_sink()
+    elif ui is None and _ui_handler_id is not None:
+        logger.remove(_ui_handler_id)
+        _ui_handler_id = None
 
 def get_ui_instance():
     """Get the UI instance for log capturing"""
     return _ui_instance
 
-# Add a handler for UI log capturing
-def log_to_ui(message):
-    """Send log messages to the UI if available"""
-    if _ui_instance:
+# Recent records for the UI. The sink is the deque's own append, so logging a
+# record costs one C-level call; the UI drains the buffer on its own timer.
+_ui_log_buffer = deque(maxlen=2000)
+
+def drain_ui_logs() -> int:
+    """Forward buffered log records to the UI instance and return how many were sent"""
+    if not _ui_instance:
+        return 0
+    count = 0
+    while _ui_log_buffer:
+        record = _ui_log_buffer.popleft().record
         try:
-            # Ensure the message is converted to string and level is extracted properly
-            msg_str = str(message.record["message"])
-            level_name = message.record["level"].name
-            _ui_instance.add_log_message(msg_str, level_name)
+            _ui_instance.add_log_message(str(record["message"]), record["level"].name)
+            count += 1
         except Exception as e:
             # Don't use logger here to avoid potential recursion
             print(f"Error sending log to UI: {e}", file=sys.stderr)
+    return count
 
-"""Initialize Loguru logging with default format"""
-# Initialize with base configuration
-logger = logger.bind(component="SYSTEM")
-logger.remove()
-
-# Add a basic console handler for initialization
-logger.add(sys.stderr,
-          level="INFO",
-          format="{time:HH:mm:ss} | {level: <8} | {extra[component]: <10} | {message}")
-
-# Configure default context
-logger = logger.bind(component="SYSTEM")
-
-# Add file handler with enhanced format for AI logs
-logger.add(log_file, 
-          level="INFO",
-          rotation="1 day",
-          retention="14 days",
-          format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {extra[component]: <10} | {message}")
-
-# Add console handler with enhanced format
-logger.add(sys.stderr, 
-          level="INFO",
-          format="{time:HH:mm:ss} | {level: <8} | {extra[component]: <10} | {message}")
+def configure_logging() -> None:
+    """Install the log sinks (only the first call has any effect)
+    
+    The file sink is always installed and the UI sink only while a UI instance
+    is registered; console output is added by the entry point (main.setup_logging).
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+    
+    # Replace loguru's default handler and give every record a component
+    logger.remove()
+    logger.configure(extra={"component": "SYSTEM"})
+    
+    # File handler with enhanced format for AI logs; records are queued and
+    # written by loguru's worker thread so callers never block on file I/O.
+    # loguru creates the log directory itself when it opens the file.
+    logger.add(log_file, 
+              level="INFO",
+              rotation="1 day",
+              retention="14 days",
+              compression=_compress_in_background,
+              enqueue=True,
+              backtrace=_DEV,
+              diagnose=_DEV,
+              format=_file_format)
+    
+    # UI handler
+    if _ui_instance is not None:
+        _add_ui_sink()
 
 # Add context manager for AI logs
 class ai_context:
@@ -79,8 +135,3 @@ class ui_context:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         pass
-
-# Add UI handler
-logger.add(log_to_ui, 
-          level="INFO",
-          format="{message}")
\ No newline at end of file
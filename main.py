@@ -1,34 +1,105 @@
 #!/usr/bin/env python3
-from typing import Optional, Dict, Any, List
-import argparse
-import curses
+from typing import Optional, Dict, Any, List, Tuple
 import os
 import sys
 import time
 import asyncio
 from datetime import datetime
-from typing import Dict, Any
 from config import load_config, BotConfig
 from mexc_client import MexcClient
 from trading_engine import TradingEngine
+from logging_config import configure_logging, set_ui_instance, drain_ui_logs, _DEV
 
 # Configure logger
 from loguru import logger
 
-logger.configure(
-    handlers=[
-        {
-            "sink": sys.stdout,
-            "format": "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-        }
-    ]
-)
+# Colour markup is only worth rendering when stdout is a terminal
+if sys.stdout.isatty():
+    _LOG_FORMAT = "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>\n{exception}"
+    _LOG_FORMAT_LOCATED = "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>\n{exception}"
+else:
+    _LOG_FORMAT = "{time:HH:mm:ss} | {level: <8} | {message}\n{exception}"
+    _LOG_FORMAT_LOCATED = "{time:HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}\n{exception}"
+
+def _log_format(record) -> str:
+    """Only show the source location for warnings and errors"""
+    return _LOG_FORMAT_LOCATED if record["level"].no >= 30 else _LOG_FORMAT
+
+_stdout_sink_id: Optional[int] = None
+
+def _add_stdout_sink() -> None:
+    """Print log records to stdout"""
+    global _stdout_sink_id
+    _stdout_sink_id = logger.add(
+        sys.stdout,
+        format=_log_format,
+        colorize=sys.stdout.isatty(),
+        backtrace=_DEV,
+        diagnose=_DEV,
+    )
+
+def _remove_stdout_sink() -> bool:
+    """Stop printing log records to stdout, returning whether the sink was installed"""
+    global _stdout_sink_id
+    if _stdout_sink_id is None:
+        return False
+    logger.remove(_stdout_sink_id)
+    _stdout_sink_id = None
+    return True
+
+def setup_logging() -> None:
+    """Install the file sink and send console log output to stdout; called by the entry points rather than on import"""
+    configure_logging()
+    _add_stdout_sink()
 
 # Constants for UI
 HEADER = "MEXC Trading Bot"
 MIN_TERMINAL_WIDTH = 80
 MIN_TERMINAL_HEIGHT = 24
 
+# Invariant pieces of the headless status screen
+HEADLESS_TITLE = "\033[1m\033[36mMEXC AI Trading Bot (Headless Mode)\033[0m"  # Cyan bold header
+RULE = "=" * 80
+SUBRULE = "-" * 40
+HEADLESS_FOOTER = ("", "Commands: [p]ause | [r]esume | [q]uit", RULE)
+GREEN = "\033[32m"
+RED = "\033[31m"
+YELLOW = "\033[33m"
+
+# Fixed part of the headless screen, filled in with str.format on each full refresh
+STATUS_TEMPLATE = "\n".join([
+    HEADLESS_TITLE,
+    RULE,
+    "",
+    "Status: {mode_color}{status}\033[0m",
+    "Last Update: {last_update}",
+    "Session Duration: {duration}",
+    "",
+    "Mode: {mode_color}{mode}\033[0m",
+    "Symbol: \033[1m{symbol}\033[0m",
+    "Current Price: \033[1m${price:.4f}\033[0m",
+    "",
+    "\033[1mAccount Information:\033[0m",
+    SUBRULE,
+    "{balance}",
+    "",
+    "\033[1mSession Statistics:\033[0m",
+    SUBRULE,
+    "Total Trades: \033[1m{trades}\033[0m",
+    "Wins/Losses: " + GREEN + "{wins}\033[0m/" + RED + "{losses}\033[0m",
+    "Win Rate: \033[1m{win_rate}\033[0m",
+    "Peak Balance: \033[1m${peak_balance:.2f}\033[0m",
+    "Session PnL: {pnl_color}${pnl:+.2f}\033[0m",
+])
+
+def split_symbol(symbol: str) -> Tuple[str, str]:
+    """Split a trading pair like BTC_USDT or BTCUSDT into (base, quote) assets"""
+    if '_' in symbol:
+        base, quote = symbol.split('_', 1)
+        return base, quote
+    # The engine standardizes symbols to underscore-free USDT pairs
+    return symbol.removesuffix('USDT'), 'USDT'
+
 class TradingBotUI:
     def __init__(self, engine: TradingEngine, headless: bool = False):
         """Initialize the UI"""
@@ -40,17 +111,23 @@ class TradingBotUI:
             self._curses_failed = False
             self._retry_count = 0
             self.MAX_RETRIES = 3
-            self._last_update = datetime.now()
-            self.session_start_time = datetime.now()
+            self._last_update = self.session_start_time = datetime.now()
             self.status = "Initializing..."
             self.paused = False
+            self._refresh_trading_params()
             
             # Update intervals and checks
             self._update_interval = getattr(engine.config.trading_params, 'ui_update_interval', 1.0)
             self._last_check = {}  # Track last check times for different components
-            self._last_full_refresh = 0.0  # Track last full refresh time
+            self._last_full_refresh = 0.0  # time.monotonic() of the last full refresh
+            self._full_refresh_min_interval = 0.25  # Debounce full refreshes to at most 4 per second
+            self._prev_lines: List[str] = []  # Rows currently drawn on screen, for diff rendering
+            self._last_repaint = 0.0  # time.monotonic() when the whole screen was last cleared and redrawn
+            self._cached_duration = (0, "00:00:00")  # (elapsed seconds, formatted session duration)
             self._last_env_mtime = os.path.getmtime('.env')  # Track .env file modification time
-            self._env_check_interval = 1.0  # Check for .env changes every second
+            self._env_check_interval = 10.0  # Seconds between .env mtime checks when watchfiles is unavailable
+            self._config_dirty = asyncio.Event()  # Set by the .env watcher task when the file changes
+            self._env_watch_task: Optional[asyncio.Task] = None
             
             # State tracking
             self._last_price = 0.0  # Track last price for minimal updates
@@ -58,6 +135,10 @@ class TradingBotUI:
             self._last_values = {}  # Track last known good values
             self._full_refresh_needed = True  # Force initial full refresh
             
+            # Recent log records, forwarded from logging_config's UI buffer on every tick
+            self.MAX_LOG_MESSAGES = 100
+            self.log_messages: List[str] = []
+            
             # Session tracking
             self.session_trades = []
             self.session_wins = 0
@@ -66,32 +147,32 @@ class TradingBotUI:
             self.session_current_balance = 0.0
             self.session_peak_balance = 0.0
             self.session_pnl = 0.0
-
-            # Session statistics
-            self.session_start_balance = 0.0
-            self.session_current_balance = 0.0
-            self.session_peak_balance = 0.0
-            self.session_trades = []
-            self.session_wins = 0
-            self.session_losses = 0
-            self.session_pnl = 0.0
             self.last_trade_time = None
-            self._full_refresh_needed = True  # Force full refresh initially
-            self._last_status = ""  # Track last status for minimal updates
-            self._full_refresh_needed = True  # Flag for full screen refresh
             self.last_prediction = None  # Track last prediction for change detection
-            self.session_start_balance = 0.0
-            self.session_current_balance = 0.0
-            self.session_start_time = datetime.now()
         except Exception as e:
             logger.error(f"Error initializing UI: {e}")
             raise
 
+    def _refresh_trading_params(self) -> None:
+        """Cache the trading settings read on every tick; call again after the engine config changes"""
+        trading_params = self.engine.config.trading_params
+        self._dry_run = trading_params.dry_run
+        self._symbol = trading_params.symbol
+        self._base, self._quote = split_symbol(self._symbol)
+
+    def add_log_message(self, message: str, level: str) -> None:
+        """Keep a log record for the status screen (first line only, cut to the screen width)"""
+        first_line = message.split("\n", 1)[0]
+        self.log_messages.append(f"{level: <8} {first_line}"[:len(RULE)])
+        if len(self.log_messages) > self.MAX_LOG_MESSAGES:
+            del self.log_messages[:-self.MAX_LOG_MESSAGES]
+        self._full_refresh_needed = True
+
     def _format_minimal_status(self, current_price: float) -> str:
         """Format the minimal status line for headless mode"""
         try:
             status = "PAUSED" if self.paused else self.status
-            mode = "DRY RUN" if self.engine.config.trading_params.dry_run else "LIVE"
+            mode = "DRY RUN" if self._dry_run else "LIVE"
             return f"\rPrice: ${current_price:.4f} | Mode: {mode} | Status: {status}"
         except Exception as e:
             logger.error(f"Error formatting minimal status: {e}")
@@ -126,58 +207,54 @@ class TradingBotUI:
             logger.error(f"Error formatting balance: {e}")
             return "Balance: Error"
 
-    async def _print_headless_status(self, current_price: float, prediction_info: Dict[str, Any]):
-        """Display status in headless mode"""
+    async def _print_headless_status(self, current_price: float, prediction_info: Dict[str, Any],
+                                     mono: Optional[float] = None, wall: Optional[datetime] = None):
+        """Display status in headless mode (mono/wall are the tick's clock readings, taken now if omitted)"""
         try:
-            # For minimal updates, just show the status line
-            if not self._full_refresh_needed:
-                print(self._format_minimal_status(current_price), end="", flush=True)
+            if mono is None:
+                mono = time.monotonic()
+            
+            # For minimal updates (or while full refreshes are debounced), just show the status line
+            if not self._full_refresh_needed or \
+               mono - self._last_full_refresh < self._full_refresh_min_interval:
+                sys.stdout.write(self._format_minimal_status(current_price))
+                sys.stdout.flush()
                 return
+            
+            # Session duration, formatted at most once per elapsed second
+            elapsed = int(((wall or datetime.now()) - self.session_start_time).total_seconds())
+            if elapsed != self._cached_duration[0]:
+                hours, rest = divmod(elapsed, 3600)
+                minutes, seconds = divmod(rest, 60)
+                self._cached_duration = (elapsed, f"{hours:02d}:{minutes:02d}:{seconds:02d}")
 
-            # Full refresh starts with clearing the screen
-            print("\033[2J\033[H", end="", flush=True)
-            
-            # Calculate session duration
-            session_duration = datetime.now() - self.session_start_time
-            hours = session_duration.seconds // 3600
-            minutes = (session_duration.seconds % 3600) // 60
-            seconds = session_duration.seconds % 60
-
-            # Build the full display with colors
-            mode = "DRY RUN" if self.engine.config.trading_params.dry_run else "LIVE TRADING"
-            mode_color = "\033[33m" if self.engine.config.trading_params.dry_run else "\033[32m"  # Yellow for dry run, green for live
-            
-            lines = [
-                "\033[1m\033[36mMEXC AI Trading Bot (Headless Mode)\033[0m",  # Cyan bold header
-                "=" * 80,
-                "",
-                f"Status: {mode_color}{'|| ' if self.paused else '> '}{self.paused and 'PAUSED' or self.status}\033[0m",
-                f"Last Update: {self._last_update.strftime('%H:%M:%S')}",
-                f"Session Duration: {hours:02d}:{minutes:02d}:{seconds:02d}",
-                "",
-                f"Mode: {mode_color}{mode}\033[0m",
-                f"Symbol: \033[1m{self.engine.config.trading_params.symbol}\033[0m",
-                f"Current Price: \033[1m${current_price:.4f}\033[0m",
-                "",
-                "\033[1mAccount Information:\033[0m",
-                "-" * 40,
-                self._format_balance_info(),
-                "",
-                "\033[1mSession Statistics:\033[0m",
-                "-" * 40,
-                f"Total Trades: \033[1m{len(self.session_trades)}\033[0m",
-                f"Wins/Losses: \033[32m{self.session_wins}\033[0m/\033[31m{self.session_losses}\033[0m",
-                f"Win Rate: \033[1m{(self.session_wins / len(self.session_trades) * 100):.1f}%\033[0m" if self.session_trades else "Win Rate: \033[1mN/A\033[0m",
-                f"Peak Balance: \033[1m${self.session_peak_balance:.2f}\033[0m",
-                f"Session PnL: {'\\033[32m' if self.session_pnl >= 0 else '\\033[31m'}${self.session_pnl:+.2f}\033[0m",
-            ]
+            # Build the full display with colors (yellow for dry run, green for live)
+            dry_run = self._dry_run
+            trade_count = len(self.session_trades)
+            lines = [STATUS_TEMPLATE.format(
+                mode_color=YELLOW if dry_run else GREEN,
+                status="|| PAUSED" if self.paused else f"> {self.status}",
+                last_update=self._last_update.strftime('%H:%M:%S'),
+                duration=self._cached_duration[1],
+                mode="DRY RUN" if dry_run else "LIVE TRADING",
+                symbol=self._symbol,
+                price=current_price,
+                balance=self._format_balance_info(),
+                trades=trade_count,
+                wins=self.session_wins,
+                losses=self.session_losses,
+                win_rate=f"{self.session_wins / trade_count * 100:.1f}%" if trade_count else "N/A",
+                peak_balance=self.session_peak_balance,
+                pnl_color=GREEN if self.session_pnl >= 0 else RED,
+                pnl=self.session_pnl,
+            )]
             
             # Add prediction info if available
             if prediction_info:
                 lines.extend([
                     "",
                     "Market Analysis:",
-                    "-" * 40,
+                    SUBRULE,
                     self._format_prediction_info(prediction_info)
                 ])
             
@@ -186,7 +263,7 @@ class TradingBotUI:
                 lines.extend([
                     "",
                     "Recent Trades:",
-                    "-" * 40,
+                    SUBRULE,
                 ])
                 # Show last 5 trades
                 for trade in self.session_trades[-5:]:
@@ -197,15 +274,38 @@ class TradingBotUI:
                     trade_result = '✅' if trade_pnl > 0 else '❌' if trade_pnl < 0 else '➖'
                     lines.append(f"{trade_result} {trade_time} {trade_type} @ ${trade_price:.4f} (${trade_pnl:+.2f})")
             
+            # Add the latest log records
+            if self.log_messages:
+                lines.extend([
+                    "",
+                    "Recent Logs:",
+                    SUBRULE,
+                ])
+                lines.extend(self.log_messages[-5:])
+            
             # Add footer with commands
-            lines.extend([
-                "",
-                "Commands: [p]ause | [r]esume | [q]uit",
-                "=" * 80
-            ])
+            lines.extend(HEADLESS_FOOTER)
+            
+            # Only redraw rows that changed since the last frame; every few seconds
+            # repaint everything in case other output (e.g. stderr) has scrolled the screen
+            frame = "\n".join(lines).split("\n")
+            if mono - self._last_repaint > 5.0:
+                self._prev_lines = []
+                self._last_repaint = mono
+            prev = self._prev_lines
+            out = [] if prev else ["\033[2J"]
+            for row, line in enumerate(frame, 1):
+                if row > len(prev) or prev[row - 1] != line:
+                    out.append(f"\033[{row};1H\033[2K{line}")
+            # Park the cursor below the frame and clear anything left over
+            out.append(f"\033[{len(frame) + 1};1H\033[J")
+            sys.stdout.write("".join(out))
+            sys.stdout.flush()
+            self._prev_lines = frame
             
-            # Print all lines
-            print("\n".join(lines))
+            # The pending full refresh has been drawn
+            self._last_full_refresh = mono
+            self._full_refresh_needed = False
             
         except Exception as e:
             logger.error(f"Error in headless display: {e}")
@@ -219,7 +319,8 @@ class TradingBotUI:
         """Update session statistics with new trade information"""
         try:
             # Add trade to history
-            trade_info['time'] = datetime.now()
+            now = datetime.now()
+            trade_info['time'] = now
             self.session_trades.append(trade_info)
             
             # Update win/loss counts
@@ -236,7 +337,7 @@ class TradingBotUI:
             self.session_peak_balance = max(self.session_peak_balance, self.session_current_balance)
             
             # Set last trade time
-            self.last_trade_time = datetime.now()
+            self.last_trade_time = now
             
             # Force full refresh of display
             self._full_refresh_needed = True
@@ -249,7 +350,7 @@ class TradingBotUI:
         try:
             logger.debug("Fetching account information...")
             
-            if self.engine.config.trading_params.dry_run:
+            if self._dry_run:
                 # Use simulated balance for dry run
                 logger.debug("Dry run mode - using simulated balance")
                 self.session_start_balance = 1000.0  # Start with 1000 USDT in dry run
@@ -260,28 +361,32 @@ class TradingBotUI:
 
             # Get real account info for live trading
             account_info = await self.engine.client.get_account()
-            logger.debug(f"Raw account info: {account_info}")
+            logger.debug("Raw account info: {}", account_info)
             
             if account_info and 'balances' in account_info:
-                base_asset = self.engine.config.trading_params.symbol.split('_')[0]
-                quote_asset = self.engine.config.trading_params.symbol.split('_')[1]
+                symbol, base_asset, quote_asset = self._symbol, self._base, self._quote
                 logger.debug(f"Processing balances for {base_asset} and {quote_asset}")
                 
+                # Only the traded pair's assets count towards the balance
+                balances = [b for b in account_info['balances'] if b['asset'] in (base_asset, quote_asset)]
+                
+                # The base asset is converted at the current price, fetched once and
+                # only when there is a base balance to convert
+                current_price = None
+                if any(b['asset'] == base_asset and float(b['free']) + float(b['locked']) for b in balances):
+                    current_price = float((await self.engine.client.get_ticker_price(symbol))['price'])
+                
                 # Calculate total balance in quote currency
                 total_balance = 0.0
-                for balance in account_info['balances']:
-                    if balance['asset'] in [base_asset, quote_asset]:
-                        if balance['asset'] == quote_asset:
-                            amount = float(balance['free']) + float(balance['locked'])
-                            logger.debug(f"{quote_asset} balance: {amount}")
-                            total_balance += amount
-                        else:
-                            # Convert base asset to quote using current price
-                            current_price = await self.engine.client.get_ticker_price(self.engine.config.trading_params.symbol)
-                            amount = float(balance['free']) + float(balance['locked'])
-                            base_value = amount * float(current_price['price'])
-                            logger.debug(f"{base_asset} balance: {amount} (Value: {base_value} {quote_asset})")
-                            total_balance += base_value
+                for balance in balances:
+                    amount = float(balance['free']) + float(balance['locked'])
+                    if balance['asset'] == quote_asset:
+                        logger.debug(f"{quote_asset} balance: {amount}")
+                        total_balance += amount
+                    elif current_price is not None:
+                        base_value = amount * current_price
+                        logger.debug(f"{base_asset} balance: {amount} (Value: {base_value} {quote_asset})")
+                        total_balance += base_value
                 
                 # Update session balance information
                 if self.session_start_balance <= 0:
@@ -295,6 +400,14 @@ class TradingBotUI:
         except Exception as e:
             logger.error(f"Error updating account info: {e}")
 
+    async def _maybe_update_account_info(self, current_time: float) -> None:
+        """Update account info if a minute (on the monotonic clock) has passed since the last update"""
+        if current_time - self._last_check.get('account_info', float('-inf')) < 60:
+            return
+        logger.debug("Updating account information...")
+        self._last_check['account_info'] = current_time
+        await self._update_account_info()
+
     async def _get_prediction_info(self) -> Dict[str, Any]:
         """Get the latest prediction information"""
         prediction_info = {}
@@ -314,24 +427,47 @@ class TradingBotUI:
         return prediction_info
 
     async def _check_config_changes(self) -> bool:
-        """Check if the config needs to be reloaded"""
+        """Check if the .env modification time has changed"""
         try:
             current_mtime = os.path.getmtime('.env')
             if current_mtime != self._last_env_mtime:
-                logger.info("Config file changed, reloading...")
                 self._last_env_mtime = current_mtime
-                self._full_refresh_needed = True
                 return True
             return False
         except Exception as e:
             logger.error(f"Error checking config changes: {e}")
             return False
 
+    async def _watch_env_file(self) -> None:
+        """Flag .env changes for the UI loop, using OS file notifications when watchfiles is installed"""
+        try:
+            from watchfiles import awatch
+            
+            # Watch the directory, not the file: editors that save by renaming a
+            # temporary file over .env would otherwise end the watch
+            async for _ in awatch('.', watch_filter=lambda change, path: os.path.basename(path) == '.env',
+                                  recursive=False):
+                self._config_dirty.set()
+        except asyncio.CancelledError:
+            raise
+        except ImportError:
+            pass
+        except Exception as e:
+            logger.warning(f"Watching .env failed, polling it instead: {e}")
+        
+        # Fall back to polling the modification time
+        while self._running:
+            await asyncio.sleep(self._env_check_interval)
+            if await self._check_config_changes():
+                self._config_dirty.set()
+
     async def start(self):
         """Start the UI loop"""
         self._running = True
         startup_timeout = 60  # 60 seconds timeout for initial startup
         self.session_start_time = datetime.now()
+        stdout_logging = False
+        set_ui_instance(self)
         
         try:
             logger.info("Starting bot initialization...")
@@ -343,6 +479,9 @@ class TradingBotUI:
                     raise Exception("Failed to initialize trading engine")
                 logger.info("Trading engine initialized successfully")
             
+            # initialize() standardizes the symbol
+            self._refresh_trading_params()
+            
             # Then initialize account info
             logger.info("Fetching initial account information...")
             await self._update_account_info()
@@ -356,53 +495,45 @@ class TradingBotUI:
             else:
                 logger.warning("Strategy initialization returned no prediction info")
                 
-            # Initialize account info
-            await self._update_account_info()
+            # The startup fetch counts as the first periodic account update
+            self._last_check['account_info'] = time.monotonic()
+            
+            # Config changes are detected off the render loop
+            self._env_watch_task = asyncio.create_task(self._watch_env_file())
+            
+            # The status screen owns stdout from here on: log lines printed over it
+            # would break the diff render, so they only reach the UI and the log file
+            stdout_logging = _remove_stdout_sink()
             
             while self._running:
                 try:
-                    # Update account info periodically (every minute)
-                    current_time = time.time()
-                    if current_time - self._last_check.get('account_info', 0) >= 60:
-                        await self._update_account_info()
-                        self._last_check['account_info'] = current_time
-                        
-                    # Get and validate current price
-                    current_price = await self.engine.client.get_ticker_price(self.engine.config.trading_params.symbol)
-                    current_price = float(current_price['price'])
-                    
-                    # Get prediction info
-                    prediction_info = await self._get_prediction_info()
+                    # One reading of each clock per tick: monotonic for intervals, wall for display
+                    mono = time.monotonic()
+                    wall = datetime.now()
                     
-                    # Update display
-                    if self.headless:
-                        await self._print_headless_status(current_price, prediction_info)
-                    else:
-                        await self._update_display(current_price, prediction_info)
-                    
-                    # Check for config changes
-                    config_changed = await self._check_config_changes()
-                    if config_changed:
+                    # Apply config changes first so a reload is shown this tick
+                    if self._config_dirty.is_set():
+                        self._config_dirty.clear()
+                        logger.info("Config file changed, reloading...")
+                        self._full_refresh_needed = True
                         await self.engine.reload_config()
+                        self._refresh_trading_params()
                     
-                    # Sleep for update interval
-                    await asyncio.sleep(self._update_interval)
-                    
-                except asyncio.TimeoutError:
-                    logger.error("Operation timed out")
-                except Exception as e:
-                    logger.error(f"Error in UI loop: {str(e)}")
-                    await asyncio.sleep(1)  # Sleep briefly on error
-                try:
-                    # Update account info periodically
-                    current_time = time.time()
-                    if current_time - self._last_check.get('account_info', 0) >= 60:
-                        logger.debug("Updating account information...")
-                        await self._update_account_info()
-                        self._last_check['account_info'] = current_time
-                        
-                    # Get and validate current price
-                    price_response = await self.engine.client.get_ticker_price(self.engine.config.trading_params.symbol)
+                    # Fetch price, prediction and (every minute) account info concurrently;
+                    # one failing request must not discard the others
+                    price_response, prediction_info, account_result = await asyncio.gather(
+                        self.engine.client.get_ticker_price(self._symbol),
+                        self._get_prediction_info(),
+                        self._maybe_update_account_info(mono),
+                        return_exceptions=True
+                    )
+                    if isinstance(account_result, Exception):
+                        logger.error(f"Error updating account info: {account_result}")
+                    if isinstance(prediction_info, Exception):
+                        logger.error(f"Error getting prediction info: {prediction_info}")
+                        prediction_info = {}
+                    if isinstance(price_response, Exception):
+                        raise price_response
                     current_price = float(price_response['price'])
                     
                     # Update state and check if full refresh is needed
@@ -411,29 +542,26 @@ class TradingBotUI:
                         self.engine.last_price = current_price
                         self._last_values['price'] = current_price
                         
-                        # Determine if we need a full refresh
+                        # Prediction or config changes may already have requested a full refresh
                         price_changed = abs(current_price - self._last_price) > 0.0001
                         status_changed = self.status != self._last_status
-                        time_for_refresh = time.time() - self._last_full_refresh > 5.0  # Full refresh every 5 seconds
-                        self._full_refresh_needed = price_changed or status_changed or time_for_refresh
-                    
-                    # Get prediction info
-                    prediction_info = await self._get_prediction_info()
+                        time_for_refresh = mono - self._last_full_refresh > 5.0  # Full refresh every 5 seconds
+                        self._full_refresh_needed = self._full_refresh_needed or price_changed or status_changed or time_for_refresh
                     
-                    # Update the display
-                    await self._print_headless_status(current_price, prediction_info)
+                    # Pick up the log records emitted since the last tick, then update the display
+                    drain_ui_logs()
+                    await self._print_headless_status(current_price, prediction_info, mono, wall)
                     
                     # Update tracking variables after successful update
                     self._last_price = current_price
                     self._last_status = self.status
-                    self._last_update = datetime.now()
-                    
-                    # Clear full refresh flag after successful update
-                    self._full_refresh_needed = False
+                    self._last_update = wall
                     
                     # Sleep for the update interval
                     await asyncio.sleep(self._update_interval)
                     
+                except asyncio.TimeoutError:
+                    logger.error("Operation timed out")
                 except Exception as e:
                     logger.error(f"Error in main loop: {e}")
                     await asyncio.sleep(1)  # Sleep on error to avoid tight loop
@@ -446,6 +574,11 @@ class TradingBotUI:
             logger.error(f"Fatal error in UI: {e}")
         finally:
             self._running = False
+            if self._env_watch_task is not None:
+                self._env_watch_task.cancel()
+            set_ui_instance(None)
+            if stdout_logging:
+                _add_stdout_sink()
             await self.stop()
 
     async def stop(self):
@@ -457,9 +590,43 @@ class TradingBotUI:
             except Exception as e:
                 logger.error(f"Error stopping engine: {e}")
 
+async def _run_start(config: BotConfig, client: MexcClient) -> None:
+    """Run the trading engine and UI until shutdown"""
+    trading_engine = TradingEngine(config, client)
+    ui = TradingBotUI(trading_engine, config.headless)
+    
+    try:
+        await ui.start()
+    except KeyboardInterrupt:
+        logger.info("Received shutdown signal")
+    except ValueError as e:
+        logger.error(f"Configuration error: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Error running UI: {e}")
+        raise
+    finally:
+        await ui.stop()
+
+async def _run_test_api(config: BotConfig, client: MexcClient) -> None:
+    """Check API connectivity and credentials, then exit"""
+    account_info = await client.get_account()
+    if not account_info:
+        raise ValueError("API test failed: account information could not be retrieved")
+    logger.info(f"API test passed: account returned {len(account_info.get('balances', []))} balances")
+
+# Command line actions, each run inside the API client context
+ACTION_HANDLERS = {
+    'start': _run_start,
+    'test-api': _run_test_api,
+}
+
 def parse_args():
+    """Parse command line options (argparse is only needed here, so it is imported on first use)"""
+    import argparse
+    
     parser = argparse.ArgumentParser(description='MEXC Trading Bot')
-    parser.add_argument('--action', type=str, choices=['start', 'test-api'], default='start', help='Bot action')
+    parser.add_argument('--action', type=str, choices=list(ACTION_HANDLERS), default='start', help='Bot action')
     parser.add_argument('--symbol', type=str, help='Trading pair symbol (e.g., BTC_USDT). If not provided, uses value from .env')
     parser.add_argument('--amount', type=float, help='Trading amount in USDT. If not provided, uses value from .env')
     parser.add_argument('--dry-run', action='store_true', help='Run in dry-run mode (no real trades)')
@@ -467,12 +634,13 @@ def parse_args():
     return parser.parse_args()
 
 async def main():
+    setup_logging()
     try:
         args = parse_args()
         logger.debug("Command line arguments: {}", args)
         
-        # Load configuration
-        config = load_config()
+        # Load configuration (a private copy: the CLI overrides below must not leak into the cached one)
+        config = load_config().model_copy(deep=True)
         logger.debug("Configuration loaded from .env")
         
         # Override config with CLI args if provided
@@ -487,6 +655,7 @@ async def main():
         if args.dry_run:
             logger.warning("Command-line dry-run flag overriding .env setting")
             config.trading_params.dry_run = True
+            config.dry_run = True
             
         if args.headless:
             logger.info("Running in headless mode")
@@ -495,25 +664,12 @@ async def main():
         # Initialize components with better error handling
         try:
             client = MexcClient(config.credentials)
-            trading_engine = TradingEngine(config, client)
-            ui = TradingBotUI(trading_engine, config.headless)
+            handler = ACTION_HANDLERS[args.action]
             
-            # Start the UI and trading engine within the API client context
+            # Run the requested action within the API client context
             async with client:
                 logger.debug("API client initialized successfully")
-                
-                try:
-                    await ui.start()
-                except KeyboardInterrupt:
-                    logger.info("Received shutdown signal")
-                except ValueError as e:
-                    logger.error(f"Configuration error: {e}")
-                    raise
-                except Exception as e:
-                    logger.error(f"Error running UI: {e}")
-                    raise
-                finally:
-                    await ui.stop()
+                await handler(config, client)
                     
         except ValueError as e:
             logger.error(f"Setup error: {e}")
@@ -526,12 +682,28 @@ async def main():
         logger.error(f"Fatal error: {e}")
         sys.exit(1)
 
+def run(coro) -> None:
+    """Run a coroutine to completion, on uvloop when it is installed (POSIX only)"""
+    loop_factory = None
+    if sys.platform != "win32":
+        # uvloop gives a faster event loop
+        try:
+            import uvloop
+            loop_factory = uvloop.new_event_loop
+        except ImportError:
+            pass
+    
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(coro)
+
 if __name__ == '__main__':
     if sys.platform == "win32":
-        os.environ['PYTHONIOENCODING'] = 'utf-8'
+        # PYTHONIOENCODING is only read at interpreter startup; re-encode the live streams instead
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+        sys.stderr.reconfigure(encoding="utf-8", errors="replace")
     
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\nBot shutdown complete")
     except Exception as e:
@@ -12,14 +12,23 @@ import hashlib
 from loguru import logger
 from config import MexcCredentials
 
+try:
+    # orjson parses API responses several times faster than the stdlib decoder
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+_CREDENTIALS_HINT = "Please check your .env file and ensure MEXC_API_KEY and MEXC_SECRET_KEY are set correctly."
+
 class MexcClient:
     """High-performance async MEXC API client with rate limiting and error handling"""
     
     BASE_URL = "https://api.mexc.com"
+    EXCHANGE_INFO_TTL = 300.0  # seconds to reuse exchangeInfo before fetching it again
     
     def __init__(self, credentials: MexcCredentials, rate_limit_rps: float = 10.0):
         if not credentials.api_key or not credentials.secret_key:
-            raise ValueError("API key and secret key are required. Please check your .env file and ensure MEXC_API_KEY and MEXC_SECRET_KEY are set correctly.")
+            raise ValueError(f"API key and secret key are required. {_CREDENTIALS_HINT}")
         
         self.api_key = credentials.api_key
         self.secret_key = credentials.secret_key
@@ -29,23 +38,52 @@ class MexcClient:
         self._last_request_time = 0
         self._request_count = 0
         self._rate_limit_lock = asyncio.Lock()
+        self._context_depth = 0  # nested `async with client:` blocks sharing the session
+        
+        # Full exchangeInfo response and per-symbol index, refreshed after EXCHANGE_INFO_TTL
+        self._exchange_info: Optional[Dict[str, Any]] = None
+        self._symbol_info: Dict[str, Dict[str, Any]] = {}
+        self._exchange_info_time = 0.0
         
         logger.info("MEXC API client initialized successfully")
         
+    async def open(self) -> "MexcClient":
+        """Open the shared HTTP session (a no-op if it is already open)"""
+        if self.session is None or self.session.closed:
+            # Keep-alive connections are pooled and reused across API calls
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(
+                    limit=20,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True
+                )
+            )
+            # Validate credentials by making a test API call
+            try:
+                await self.validate_credentials()
+            except Exception:
+                await self.close()
+                raise
+        return self
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+    
     async def __aenter__(self):
-        """Async context manager entry"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
-        )
-        # Validate credentials by making a test API call
-        await self.validate_credentials()
+        """Async context manager entry; nested entries reuse the open session"""
+        await self.open()
+        self._context_depth += 1
         return self
 
     async def validate_credentials(self):
         """Validate API credentials by making a test API call"""
         if not self.api_key or not self.secret_key:
-            raise ValueError("API key and secret key are required but missing. Please check your .env file.")
+            raise ValueError(f"API key and secret key are required but missing. {_CREDENTIALS_HINT}")
             
         try:
             # Test API access by getting account info
@@ -81,8 +119,8 @@ class MexcClient:
                 headers=headers
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    logger.debug(f"Account info received: {data}")
+                    data = await response.json(loads=_json_loads)
+                    logger.debug("Account info received: {}", data)
                     return data
                 else:
                     logger.error(f"Failed to get account info: {response.status}")
@@ -92,24 +130,13 @@ class MexcClient:
         except Exception as e:
             logger.error(f"Error fetching account info: {str(e)}")
             return None
-            
-        try:
-            # Try to get account information
-            await self.get_account_info()
-            logger.info("API credentials validated successfully")
-        except aiohttp.ClientResponseError as e:
-            if e.status == 401:
-                raise ValueError(f"Invalid API credentials: Authorization failed. Please check your MEXC_API_KEY and MEXC_SECRET_KEY in the .env file.")
-            else:
-                raise ValueError(f"API error (HTTP {e.status}): {str(e)}")
-        except Exception as e:
-            logger.error(f"Failed to validate API credentials: {str(e)}")
-            raise ValueError(f"API validation failed: {str(e)}. Please check your MEXC_API_KEY and MEXC_SECRET_KEY in the .env file.")
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit; the session is closed when the outermost block exits"""
+        self._context_depth -= 1
+        if self._context_depth <= 0:
+            self._context_depth = 0
+            await self.close()
     
     def _generate_signature(self, query_string: str) -> str:
         """Generate HMAC SHA256 signature for API requests"""
@@ -136,7 +163,7 @@ class MexcClient:
             if response.status != 200:
                 text = await response.text()
                 raise ValueError(f"API request failed: {text}")
-            return await response.json()
+            return await response.json(loads=_json_loads)
 
     async def get_ticker_price(self, symbol: str) -> Dict[str, Any]:
         """Get current ticker price for a symbol"""
@@ -147,13 +174,13 @@ class MexcClient:
         
         if not self.session:
             logger.error("API client session not initialized")
-            await self.__aenter__()
+            await self.open()
         
         try:
             logger.debug(f"Fetching ticker price for {symbol}")
             url = f"{self.BASE_URL}{endpoint}"
             logger.debug(f"Full URL: {url}")
-            logger.debug(f"Request params: {params}")
+            logger.debug("Request params: {}", params)
             
             async with self.session.get(
                 url,
@@ -162,15 +189,15 @@ class MexcClient:
             ) as response:
                 response_text = await response.text()
                 logger.debug(f"Response status: {response.status}")
-                logger.debug(f"Raw response: {response_text[:200]}...")
+                logger.opt(lazy=True).debug("Raw response: {}...", lambda: response_text[:200])
                 
                 if response.status != 200:
                     logger.error(f"API error getting ticker price: {response.status} - {response_text}")
                     return {"price": "0"}
                 
                 try:
-                    ticker = json.loads(response_text)
-                    logger.debug(f"Parsed ticker response: {ticker}")
+                    ticker = _json_loads(response_text)
+                    logger.debug("Parsed ticker response: {}", ticker)
                     return ticker
                 except json.JSONDecodeError as e:
                     logger.error(f"Failed to parse ticker price JSON response: {e}")
@@ -197,13 +224,13 @@ class MexcClient:
         
         if not self.session:
             logger.error("API client session not initialized")
-            await self.__aenter__()
+            await self.open()
         
         try:
             logger.debug(f"Fetching klines for {symbol} [{interval}] with limit {limit}")
             url = f"{self.BASE_URL}{endpoint}"
             logger.debug(f"Full URL: {url}")
-            logger.debug(f"Request params: {params}")
+            logger.debug("Request params: {}", params)
             
             async with self.session.get(
                 url,
@@ -212,14 +239,14 @@ class MexcClient:
             ) as response:
                 response_text = await response.text()
                 logger.debug(f"Response status: {response.status}")
-                logger.debug(f"Raw response: {response_text[:200]}...")  # Log first 200 chars
+                logger.opt(lazy=True).debug("Raw response: {}...", lambda: response_text[:200])  # Log first 200 chars
                 
                 if response.status != 200:
                     logger.error(f"API error: {response.status} - {response_text}")
                     return []
                 
                 try:
-                    klines = json.loads(response_text)
+                    klines = _json_loads(response_text)
                 except json.JSONDecodeError as e:
                     logger.error(f"Failed to parse JSON response: {e}")
                     return []
@@ -309,14 +336,14 @@ class MexcClient:
                 response_text = await response.text()
                 
                 if response.status == 200:
-                    return json.loads(response_text)
+                    return _json_loads(response_text)
                 else:
                     logger.error(f"API Error {response.status}: {response_text}")
                     
                     # Provide more helpful error messages
                     if response.status == 400:
                         try:
-                            error_data = json.loads(response_text)
+                            error_data = _json_loads(response_text)
                             if error_data.get('code') == 10007:
                                 logger.error("Symbol not supported. Use get_exchange_info() to see available symbols.")
                         except:
@@ -357,10 +384,36 @@ class MexcClient:
             return {}
 
     async def get_exchange_info(self, symbol: Optional[str] = None) -> Dict[str, Any]:
-        """Get exchange information and available symbols"""
+        """Get exchange information and available symbols (served from a short-lived cache)"""
+        info = await self._get_cached_exchange_info()
+        if not symbol:
+            return info
+        symbol_info = self._symbol_info.get(symbol.upper())
+        return {**info, 'symbols': [symbol_info] if symbol_info else []}
+    
+    async def get_symbol_info(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Get trading rules for one symbol from the cached exchange information"""
+        await self._get_cached_exchange_info()
+        return self._symbol_info.get(symbol.upper())
+    
+    async def validate_symbol(self, symbol: str) -> bool:
+        """Check that a symbol is listed on the exchange (answered from the exchangeInfo cache)"""
+        return await self.get_symbol_info(symbol) is not None
+    
+    async def _get_cached_exchange_info(self) -> Dict[str, Any]:
+        """Return the full exchangeInfo, fetching it at most once per EXCHANGE_INFO_TTL"""
+        if self._exchange_info is None or time.monotonic() - self._exchange_info_time > self.EXCHANGE_INFO_TTL:
+            info = await self._fetch_exchange_info()
+            if not info:
+                return self._exchange_info or {}
+            self._exchange_info = info
+            self._symbol_info = {s['symbol']: s for s in info.get('symbols', []) if 'symbol' in s}
+            self._exchange_info_time = time.monotonic()
+        return self._exchange_info
+    
+    async def _fetch_exchange_info(self) -> Dict[str, Any]:
+        """Fetch exchange information for all symbols"""
         params = {}
-        if symbol:
-            params['symbol'] = symbol
         
         try:
             # Try the standard endpoint first
@@ -22,11 +22,6 @@ def check_requirements():
         else:
             errors.append("Configuration file '.env' not found. Please create it with your MEXC API credentials.")
     
-    # Check if logs directory exists
-    if not os.path.exists('logs'):
-        print("Creating logs directory...")
-        os.makedirs('logs', exist_ok=True)
-    
     # Try to import main modules
     try:
         import main
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Unit tests for environment-based configuration loading"""
+import pytest
+from pydantic import ValidationError
+from config import load_config, reload_config
+
+def test_ai_config_from_environment(monkeypatch):
+    """AI settings are read from the environment and converted to their field types"""
+    monkeypatch.setenv("PREDICTION_LENGTH", "6")
+    monkeypatch.setenv("MAX_HISTORICAL_DATA", "250")
+    monkeypatch.setenv("CONFIDENCE_THRESHOLD", "0.8")
+    monkeypatch.setenv("FEATURE_COLUMNS", "close,volume")
+
+    load_config.cache_clear()
+    ai_config = load_config().ai_config
+
+    assert ai_config.prediction_length == 6
+    assert ai_config.max_historical_data == 250
+    assert ai_config.confidence_threshold == 0.8
+    assert ai_config.feature_columns == ["close", "volume"]
+
+def test_load_config_is_cached_until_reload(monkeypatch):
+    """load_config() returns the same object until reload_config() re-reads the environment"""
+    monkeypatch.setenv("TRADING_SYMBOL", "ETH_USDT")
+    config = reload_config()
+    assert load_config() is config
+
+    monkeypatch.setenv("TRADING_SYMBOL", "XRP_USDT")
+    assert load_config().trading_params.symbol == "ETH_USDT"
+    assert reload_config().trading_params.symbol == "XRP_USDT"
+
+def test_env_bool_values():
+    """Boolean flags accept the usual truthy spellings and fall back to the default"""
+    from config import _env_bool
+
+    assert _env_bool({"FLAG": " Yes "}, "FLAG", False) is True
+    assert _env_bool({"FLAG": "1"}, "FLAG", False) is True
+    assert _env_bool({"FLAG": "false"}, "FLAG", True) is False
+    assert _env_bool({}, "FLAG", True) is True
+
+def test_config_models_reject_unknown_fields():
+    """Misspelled settings fail validation instead of being ignored"""
+    from config import TradingParams
+
+    with pytest.raises(ValidationError):
+        TradingParams(symbol="BTC_USDT", dryrun=False)
+
+def test_time_window_minutes():
+    """Window bounds are exposed as minutes after midnight"""
+    from config import TimeWindow
+
+    window = TimeWindow(start="#09:30", end="17:05")
+    assert window.start_minute == 570
+    assert window.end_minute == 1025
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Unit tests for the logging configuration"""
+from loguru import logger
+import logging_config
+
+class RecordingUI:
+    """Minimal UI that records the log messages it receives"""
+    def __init__(self):
+        self.messages = []
+
+    def add_log_message(self, message, level):
+        self.messages.append((message, level))
+
+def test_ui_logs_are_buffered_until_drained():
+    """Records wait in the ring buffer until the UI drains them"""
+    handler_id = logger.add(logging_config._ui_log_buffer.append, level="INFO", format="{message}")
+    ui = RecordingUI()
+    try:
+        logging_config.set_ui_instance(ui)
+        logger.info("first")
+        logger.warning("second")
+        assert ui.messages == []
+
+        assert logging_config.drain_ui_logs() == 2
+        assert ui.messages == [("first", "INFO"), ("second", "WARNING")]
+        assert logging_config.drain_ui_logs() == 0
+    finally:
+        logger.remove(handler_id)
+        logging_config.set_ui_instance(None)
+        logging_config._ui_log_buffer.clear()
+
+def test_line_format_pads_columns():
+    """Level and component columns are padded once into the cached format string"""
+    fmt = logging_config._line_format("HH:mm:ss", "INFO", "AI")
+    assert fmt == "{time:HH:mm:ss} | INFO     | AI         | {message}\n{exception}"
+    assert logging_config._line_format("HH:mm:ss", "INFO", "AI") is fmt
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Unit tests for the headless terminal UI that need no exchange connection"""
+import sys
+import types
+import asyncio
+from trading_engine import TradingEngine
+from main import TradingBotUI, GREEN, RED
+
+def create_test_ui(make_config, tmp_path, monkeypatch) -> TradingBotUI:
+    """Create a headless UI over an offline engine, with a throwaway .env in the working directory"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env").write_text("")
+    return TradingBotUI(TradingEngine(make_config(), None), headless=True)
+
+def test_full_refresh_colours_session_pnl(make_config, tmp_path, monkeypatch, capsys):
+    """The session PnL is drawn in green when positive and red when negative"""
+    ui = create_test_ui(make_config, tmp_path, monkeypatch)
+    ui.session_pnl = 12.5
+    asyncio.run(ui._print_headless_status(100.0, {}))
+    assert f"Session PnL: {GREEN}$+12.50" in capsys.readouterr().out
+
+    ui.session_pnl = -3.0
+    ui._full_refresh_needed = True
+    ui._last_full_refresh -= 1
+    asyncio.run(ui._print_headless_status(100.0, {}))
+    assert f"Session PnL: {RED}$-3.00" in capsys.readouterr().out
+
+def test_full_refresh_redraws_only_changed_rows(make_config, tmp_path, monkeypatch, capsys):
+    """After the first frame, a refresh rewrites just the rows whose text changed"""
+    ui = create_test_ui(make_config, tmp_path, monkeypatch)
+    asyncio.run(ui._print_headless_status(100.0, {}))
+    capsys.readouterr()
+
+    ui._full_refresh_needed = True
+    ui._last_full_refresh -= 1
+    asyncio.run(ui._print_headless_status(101.0, {}))
+    out = capsys.readouterr().out
+    assert "$101.0000" in out
+    assert "Session Statistics" not in out
+    assert ui._full_refresh_needed is False
+
+def test_account_balance_fetches_price_once(make_config, tmp_path, monkeypatch):
+    """Live balances are valued with one ticker request, skipped when there is no base balance"""
+    ui = create_test_ui(make_config, tmp_path, monkeypatch)
+    ui._dry_run = False
+    ticker_requests = []
+
+    class FakeClient:
+        def __init__(self, balances):
+            self.balances = balances
+
+        async def get_account(self):
+            return {'balances': self.balances}
+
+        async def get_ticker_price(self, symbol):
+            ticker_requests.append(symbol)
+            return {'price': '20000'}
+
+    ui.engine.client = FakeClient([
+        {'asset': 'USDT', 'free': '100', 'locked': '50'},
+        {'asset': 'BTC', 'free': '0.01', 'locked': '0'},
+        {'asset': 'ETH', 'free': '5', 'locked': '0'},
+    ])
+    asyncio.run(ui._update_account_info())
+    assert ui.session_current_balance == 350.0
+    assert ticker_requests == ['BTC_USDT']
+
+    ui.engine.client = FakeClient([{'asset': 'USDT', 'free': '10', 'locked': '0'}, {'asset': 'BTC', 'free': '0', 'locked': '0'}])
+    asyncio.run(ui._update_account_info())
+    assert ui.session_current_balance == 10.0
+    assert len(ticker_requests) == 1
+
+def test_log_messages_are_shown_on_the_status_screen(make_config, tmp_path, monkeypatch, capsys):
+    """Forwarded log records appear under Recent Logs, one screen line each"""
+    ui = create_test_ui(make_config, tmp_path, monkeypatch)
+    for i in range(ui.MAX_LOG_MESSAGES + 10):
+        ui.add_log_message(f"message {i}\nsecond line", "INFO")
+    assert len(ui.log_messages) == ui.MAX_LOG_MESSAGES
+
+    asyncio.run(ui._print_headless_status(100.0, {}))
+    out = capsys.readouterr().out
+    assert "Recent Logs:" in out
+    assert f"INFO     message {ui.MAX_LOG_MESSAGES + 9}" in out
+    assert "second line" not in out
+
+def test_env_watch_falls_back_to_polling(make_config, tmp_path, monkeypatch):
+    """A failing file watcher hands over to .env mtime polling instead of giving up"""
+    ui = create_test_ui(make_config, tmp_path, monkeypatch)
+
+    def awatch(*args, **kwargs):
+        raise OSError("inotify watch limit reached")
+
+    monkeypatch.setitem(sys.modules, "watchfiles", types.SimpleNamespace(awatch=awatch))
+    ui._running = True
+    ui._env_check_interval = 0
+    ui._last_env_mtime -= 1
+
+    async def run():
+        watcher = asyncio.create_task(ui._watch_env_file())
+        await asyncio.wait_for(ui._config_dirty.wait(), timeout=1)
+        watcher.cancel()
+
+    asyncio.run(run())
+
+def test_log_messages_redraw_only_the_log_rows(make_config, tmp_path, monkeypatch, capsys):
+    """A forwarded log record requests a refresh that rewrites just the changed rows, not the whole screen"""
+    ui = create_test_ui(make_config, tmp_path, monkeypatch)
+    asyncio.run(ui._print_headless_status(100.0, {}))
+    capsys.readouterr()
+
+    ui.add_log_message("Config file changed, reloading...", "INFO")
+    assert ui._full_refresh_needed is True
+    ui._last_full_refresh -= 1
+    asyncio.run(ui._print_headless_status(100.0, {}))
+    out = capsys.readouterr().out
+    assert "\033[2J" not in out
+    assert "Config file changed, reloading..." in out
+    assert "Session Statistics" not in out
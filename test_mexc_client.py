@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Unit tests for the MEXC client that need no network access"""
+import asyncio
+from mexc_client import MexcClient
+
+def create_test_client(make_config) -> MexcClient:
+    """Create a client whose credential check always succeeds without calling the API"""
+    client = MexcClient(make_config().credentials)
+    client.validation_calls = 0
+
+    async def validate_credentials():
+        client.validation_calls += 1
+        return True
+
+    client.validate_credentials = validate_credentials
+    return client
+
+def test_nested_contexts_share_one_session(make_config):
+    """Nested `async with client:` blocks reuse the session, which closes with the outermost block"""
+    async def run():
+        client = create_test_client(make_config)
+        async with client:
+            session = client.session
+            async with client:
+                assert client.session is session
+            assert not session.closed
+        assert client.session is None
+        assert session.closed
+        assert client.validation_calls == 1
+
+    asyncio.run(run())
+
+def test_exchange_info_is_cached(make_config):
+    """Symbol lookups are answered from one exchangeInfo fetch until the cache expires"""
+    async def run():
+        client = create_test_client(make_config)
+        requests = []
+
+        async def make_request(method, endpoint, params=None, signed=False):
+            requests.append(endpoint)
+            return {'timezone': 'UTC', 'symbols': [{'symbol': 'BTCUSDT'}, {'symbol': 'XRPUSDT'}]}
+
+        client._make_request = make_request
+        assert await client.validate_symbol('xrpusdt')
+        assert not await client.validate_symbol('FOOUSDT')
+        assert (await client.get_exchange_info('BTCUSDT'))['symbols'] == [{'symbol': 'BTCUSDT'}]
+        assert len(requests) == 1
+
+        client._exchange_info_time -= client.EXCHANGE_INFO_TTL + 1
+        await client.get_exchange_info()
+        assert len(requests) == 2
+
+    asyncio.run(run())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Unit tests for the Chronos trading strategy"""
+from config import AIConfig
+from chronos_strategy import ChronosTradingStrategy
+
+def create_test_strategy(make_config, **ai_overrides) -> ChronosTradingStrategy:
+    """Create a strategy with a small, offline test configuration"""
+    return ChronosTradingStrategy(make_config(ai_config=AIConfig(**ai_overrides)))
+
+def test_ring_buffer_keeps_most_recent_prices(make_config):
+    """Only the last max_historical_data prices are kept, oldest first"""
+    strategy = create_test_strategy(make_config, max_historical_data=5)
+    for price in range(1, 9):
+        strategy.update_data(float(price))
+
+    assert list(strategy.historical_prices) == [4.0, 5.0, 6.0, 7.0, 8.0]
+    assert list(strategy._recent(3)) == [6.0, 7.0, 8.0]
+
+def test_ring_buffer_ignores_invalid_prices(make_config):
+    """Non-positive and missing prices are not stored"""
+    strategy = create_test_strategy(make_config, max_historical_data=5)
+    for price in (1.0, None, 0.0, -2.0, 3.0):
+        strategy.update_data(price)
+
+    assert list(strategy.historical_prices) == [1.0, 3.0]
+
+def test_trend_stats_mean_change():
+    """Mean change over the window matches the average of consecutive differences"""
+    from chronos_strategy import _trend_stats
+
+    # Window 10 -> 9 -> 7 -> 6
+    mean_change, strength = _trend_stats(10.0, 6.0, 4)
+    assert mean_change == -4.0 / 3
+    assert strength == 4.0 / 3
+
+def test_predict_rising_trend(make_config):
+    """A steady rise produces an UP prediction extrapolated from the mean change"""
+    strategy = create_test_strategy(make_config, lookback_periods=5, prediction_length=2)
+    for price in (100.0, 101.0, 102.0, 103.0, 104.0):
+        strategy.update_data(price)
+
+    prediction = strategy.predict()
+    assert prediction['direction'] == 'UP'
+    assert prediction['prediction'] == 106.0
+
+def test_predict_uses_latest_window_after_wrap(make_config):
+    """The trend is read from the newest lookback window once the buffer wraps"""
+    strategy = create_test_strategy(make_config, lookback_periods=3, max_historical_data=4)
+    for price in (50.0, 40.0, 30.0, 100.0, 101.0, 102.0):
+        strategy.update_data(price)
+
+    prediction = strategy.predict()
+    assert prediction['direction'] == 'UP'
+    assert prediction['trend_strength'] == 1.0
+
+def test_extend_data_matches_update_data(make_config):
+    """Batch ingestion leaves the buffer in the same state as per-price updates"""
+    prices = [float(p) for p in range(1, 12)] + [0.0, 12.0]
+    for batches in ([prices], [prices[:3], prices[3:6], prices[6:]]):
+        batched = create_test_strategy(make_config, max_historical_data=5)
+        single = create_test_strategy(make_config, max_historical_data=5)
+        single.update_data(99.0)
+        batched.update_data(99.0)
+        for batch in batches:
+            batched.extend_data(batch)
+        for price in prices:
+            single.update_data(price)
+
+        assert list(batched.historical_prices) == list(single.historical_prices)
+
+def test_predict_is_memoized_until_new_data(make_config):
+    """Repeated predict() calls reuse the result until a new price arrives"""
+    strategy = create_test_strategy(make_config, lookback_periods=3)
+    strategy.extend_data([100.0, 101.0, 102.0])
+
+    first = strategy.predict()
+    assert strategy.predict() is first
+
+    strategy.update_data(103.0)
+    assert strategy.predict() is not first
+
+def test_predict_returns_plain_floats(make_config):
+    """Prediction values are Python floats rather than NumPy scalars"""
+    strategy = create_test_strategy(make_config, lookback_periods=3)
+    strategy.extend_data([100.0, 101.0, 102.0])
+
+    prediction = strategy.predict()
+    assert type(prediction['prediction']) is float
+    assert type(prediction['trend_strength']) is float
+
+def test_generate_signal_follows_prediction(make_config):
+    """A confident UP prediction maps to BUY and reports the latest price"""
+    strategy = create_test_strategy(make_config, lookback_periods=3, confidence_threshold=0.5)
+    assert strategy.generate_signal() == "NEUTRAL"
+
+    strategy.extend_data([100.0, 101.0, 102.0])
+    assert strategy.generate_signal() == "BUY"
+    assert strategy.get_prediction_info()['current_price'] == 102.0
+
+def test_last_prediction_expires_on_monotonic_clock(make_config):
+    """get_last_prediction() recomputes once update_interval has elapsed"""
+    strategy = create_test_strategy(make_config, lookback_periods=3, prediction_length=1, update_interval=60)
+    strategy.extend_data([100.0, 101.0, 102.0])
+    strategy.predict()
+
+    assert strategy.get_last_prediction()['prediction'] is None
+
+    strategy.last_prediction_monotonic -= 61
+    assert strategy.get_last_prediction()['prediction'] == 103.0
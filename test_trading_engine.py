@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Unit tests for the trading engine that need no exchange connection"""
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+from config import TimeWindow
+from trading_engine import TradingEngine
+
+def create_test_engine(make_config, **config_overrides) -> TradingEngine:
+    """Create an engine with an offline test configuration and no client"""
+    return TradingEngine(make_config(**config_overrides), None)
+
+def _window_around_now(offset_minutes: int, enabled: bool = True) -> TimeWindow:
+    """A two-hour UTC window centred offset_minutes away from the current time"""
+    now = datetime.now(timezone.utc)
+    centre = (now.hour * 60 + now.minute + offset_minutes) % 1440
+    start, end = (centre - 60) % 1440, (centre + 60) % 1440
+    return TimeWindow(start=f"{start // 60:02d}:{start % 60:02d}", end=f"{end // 60:02d}:{end % 60:02d}", enabled=enabled)
+
+def test_is_trading_time_windows(make_config):
+    """Trading is allowed inside a window (including overnight ones) and blocked outside"""
+    assert asyncio.run(create_test_engine(make_config).is_trading_time())
+    assert asyncio.run(create_test_engine(make_config, trading_windows=[_window_around_now(0)]).is_trading_time())
+    assert not asyncio.run(create_test_engine(make_config, trading_windows=[_window_around_now(720)]).is_trading_time())
+    assert not asyncio.run(create_test_engine(make_config, trading_windows=[_window_around_now(0, enabled=False)]).is_trading_time())
+
+def test_seconds_until_trading_window(make_config):
+    """The wait runs up to the start of the next enabled window"""
+    assert create_test_engine(make_config).seconds_until_trading_window() == 0.0
+
+    engine = create_test_engine(make_config, trading_windows=[_window_around_now(720), _window_around_now(180)])
+    wait_seconds = engine.seconds_until_trading_window()
+    assert 119 * 60 < wait_seconds <= 120 * 60
+
+    engine = create_test_engine(make_config, trading_windows=[_window_around_now(720), _window_around_now(180, enabled=False)])
+    assert 659 * 60 < engine.seconds_until_trading_window() <= 660 * 60
+
+def test_daily_counters_reset_on_new_day(make_config):
+    """Daily counters are cleared once the date changes, at any time of day"""
+    engine = create_test_engine(make_config)
+    engine.daily_order_count = 3
+    engine.daily_trades = 2
+    assert engine.stop_loss_orders == {}
+
+    engine._reset_daily_counters()
+    assert engine.daily_order_count == 3
+
+    engine.last_reset_date -= timedelta(days=1)
+    engine._reset_daily_counters()
+    assert engine.daily_order_count == 0
+    assert engine.daily_trades == 0
+
+def test_sleep_wakes_on_stop(make_config):
+    """stop() interrupts a long engine sleep immediately"""
+    async def run():
+        engine = create_test_engine(make_config)
+        sleeper = asyncio.create_task(engine._sleep(3600))
+        await asyncio.sleep(0)
+        await engine.stop()
+        assert await asyncio.wait_for(sleeper, timeout=1) is True
+        assert await engine._sleep(0) is True
+
+    asyncio.run(run())
+
+def test_monitor_positions_exits_on_stop(make_config):
+    """The position monitor loop returns as soon as the engine is stopped"""
+    async def run():
+        engine = create_test_engine(make_config)
+        monitor = asyncio.create_task(engine.monitor_positions())
+        await asyncio.sleep(0)
+        await engine.stop()
+        await asyncio.wait_for(monitor, timeout=1)
+
+    asyncio.run(run())
+
+def test_bracket_orders_reject_bad_prices_first(make_config):
+    """Invalid bracket prices raise before any trading-window or order-limit checks"""
+    async def run():
+        engine = create_test_engine(make_config)
+        engine.daily_order_count = engine.config.trading_params.max_orders_per_day
+        for method in (engine.place_sequential_bracket_buy_order, engine.place_simple_bracket_order):
+            with pytest.raises(ValueError):
+                await method(0.0, -1.0, 1.0)
+            with pytest.raises(ValueError):
+                await method(1.0, 1.1, 2.0)
+
+    asyncio.run(run())
+
+def test_initialize_is_idempotent(make_config):
+    """Once initialized, further initialize() calls return without touching the client until stop()"""
+    async def run():
+        engine = create_test_engine(make_config)
+        engine._initialized = True
+        assert await engine.initialize() is True
+        await engine.stop()
+        assert engine._initialized is False
+
+    asyncio.run(run())
+
+def test_bracket_prices_snap_to_tick():
+    """Bracket prices keep full precision for low-priced pairs and align to the tick size"""
+    from decimal import Decimal
+    from trading_engine import _bracket_prices, _price_tick
+
+    tick = _price_tick({'filters': [{'filterType': 'PRICE_FILTER', 'tickSize': '0.00000001'}]})
+    assert _bracket_prices(0.00001234, 5, 10, tick) == (0.00001172, 0.00001357)
+    assert _price_tick({'quotePrecision': 4, 'filters': []}) == Decimal('0.0001')
+    assert _bracket_prices(2.0, 5, 10) == (1.9, 2.2)
+
+def test_bracket_stats():
+    """Bracket cost, risk and reward are computed exactly from the order prices"""
+    from decimal import Decimal
+    from trading_engine import _bracket_stats
+
+    total_cost, max_loss, max_profit, rr_ratio = _bracket_stats(1.1, 1.0, 1.4, 10)
+    assert total_cost == Decimal('11.0')
+    assert max_loss == Decimal('1.0')
+    assert max_profit == Decimal('3.0')
+    assert rr_ratio == 3
+
+def test_reload_config_leaves_cached_config_untouched(make_config, tmp_path, monkeypatch):
+    """The engine standardizes the symbol on its own copy, not on the config load_config() hands out"""
+    from config import load_config
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("TRADING_SYMBOL", "BTC_USDT")
+    engine = create_test_engine(make_config)
+    assert asyncio.run(engine.reload_config()) is True
+
+    assert engine.config.trading_params.symbol == "BTCUSDT"
+    assert load_config().trading_params.symbol == "BTC_USDT"
+
+def test_initialize_rejects_unlisted_symbol(make_config):
+    """Startup stops before loading market data when the exchange does not list the symbol"""
+    calls = []
+
+    class FakeClient:
+        session = object()
+
+        async def validate_symbol(self, symbol):
+            calls.append(symbol)
+            return False
+
+        async def get_klines(self, **kwargs):
+            calls.append('klines')
+
+    engine = TradingEngine(make_config(), FakeClient())
+    assert asyncio.run(engine.initialize()) is False
+    assert calls == ['BTCUSDT']
@@ -25,7 +25,7 @@ def test_logging():
         logger.info(f"Test message {i}")
     
     # Verify log file creation
-    log_file = f"logs/MEXCL_{time.strftime('%Y-%m-%d')}.log"
+    log_file = "logs/MEXC.log"
     assert os.path.exists(log_file), "Log file was not created"
     
     # Test UI log capture
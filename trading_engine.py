@@ -1,25 +1,59 @@
-import pytz
 import asyncio
-import numpy as np
 import time
 from datetime import datetime, timedelta
+from decimal import Decimal, ROUND_HALF_UP
 from typing import Dict, Any, Optional, List, Tuple
+from zoneinfo import ZoneInfo
 from loguru import logger
 from mexc_client import MexcClient
 from config import BotConfig, TimeWindow, AIConfig
 from chronos_strategy import ChronosTradingStrategy
 
+def _price_tick(symbol_info: Optional[Dict[str, Any]]) -> Optional[Decimal]:
+    """Price increment for a symbol from its exchangeInfo rules, if known"""
+    if not symbol_info:
+        return None
+    for price_filter in symbol_info.get('filters', []):
+        if price_filter.get('filterType') == 'PRICE_FILTER' and price_filter.get('tickSize'):
+            return Decimal(price_filter['tickSize'])
+    precision = symbol_info.get('quotePrecision')
+    if precision is not None:
+        return Decimal(1).scaleb(-int(precision))
+    return None
+
+def _bracket_prices(price: float, stop_loss_pct: float, take_profit_pct: float,
+                    tick: Optional[Decimal] = None) -> Tuple[float, float]:
+    """Stop-loss and take-profit prices for a buy at `price`, snapped to the tick size"""
+    entry = Decimal(str(price))
+    stop_loss = entry * (1 - Decimal(str(stop_loss_pct)) / 100)
+    take_profit = entry * (1 + Decimal(str(take_profit_pct)) / 100)
+    if tick:
+        stop_loss = (stop_loss / tick).to_integral_value(ROUND_HALF_UP) * tick
+        take_profit = (take_profit / tick).to_integral_value(ROUND_HALF_UP) * tick
+    return float(stop_loss), float(take_profit)
+
+def _bracket_stats(entry_price: float, stop_loss_price: float, take_profit_price: float,
+                   quantity: float) -> Tuple[Decimal, Decimal, Decimal, Decimal]:
+    """(total cost, max loss, max profit, reward/risk ratio) of a bracket buy"""
+    entry = Decimal(str(entry_price))
+    qty = Decimal(str(quantity))
+    max_loss = (entry - Decimal(str(stop_loss_price))) * qty
+    max_profit = (Decimal(str(take_profit_price)) - entry) * qty
+    rr_ratio = max_profit / max_loss if max_loss else Decimal(0)
+    return entry * qty, max_loss, max_profit, rr_ratio
+
 class TradingEngine:
     """High-performance trading engine with stop-loss, time windows, and order management"""
     
     def __init__(self, config: BotConfig, client: MexcClient):
-        self.config = config
+        self.config = config.model_copy(deep=True)  # initialize() rewrites the symbol, so keep a private copy
         self.client = client
-        self.chronos = ChronosTradingStrategy(config)  # Initialize with config
+        self.chronos = ChronosTradingStrategy(self.config)  # Initialize with config
         self.last_signal = None
         self.last_price = None
         self.historical_prices = []
         self._running = False
+        self._initialized = False  # set once initialize() has loaded market data
         self._stop_event = asyncio.Event()
         self.ui_update_callback = None
         # Trading state
@@ -28,11 +62,13 @@ class TradingEngine:
         self.signals = []
         self.daily_trades = 0
         self.daily_order_count = 0  # Track daily order count
+        self.last_reset_date = datetime.now().date()
+        self.stop_loss_orders: Dict[str, int] = {}  # position_id -> stop_loss_order_id
         
         # Rate limiting and updates
         self._last_price_update = 0
         self._last_klines = []
-        self._last_signal_time = 0
+        self._last_signal_time = float('-inf')  # time.monotonic() of the last acted-on signal
         self._min_signal_interval = 60  # Minimum seconds between signals
         
         # Performance metrics
@@ -60,10 +96,10 @@ class TradingEngine:
         
     async def reload_config(self):
         """Reload configuration from .env and reinitialize components"""
-        from config import load_config
+        from config import reload_config
         try:
-            # Load fresh config from .env
-            new_config = load_config()
+            # Load fresh config from .env (copied: the cached instance is shared with other callers)
+            new_config = reload_config().model_copy(deep=True)
             old_symbol = self.config.trading_params.symbol
             
             # Standardize both old and new symbols
@@ -94,6 +130,7 @@ class TradingEngine:
                 self.loss_count = 0
                 
                 # Reinitialize with new symbol
+                self._initialized = False
                 await self.initialize()
                 logger.info(f"Trading engine reinitialized with new symbol: {new_symbol_std}")
             else:
@@ -117,14 +154,18 @@ class TradingEngine:
         return symbol.upper()
     
     async def initialize(self):
-        """Initialize the trading engine and load historical data"""
+        """Initialize the trading engine and load historical data (a no-op once it has succeeded)"""
+        if self._initialized:
+            return True
+        
         logger.info("Initializing trading engine...")
         
         try:
             # Standardize symbol format
             raw_symbol = self.config.trading_params.symbol
-            self.config.trading_params.symbol = self._standardize_symbol(raw_symbol)
-            logger.debug(f"Standardized symbol: {raw_symbol} -> {self.config.trading_params.symbol}")
+            symbol = self._standardize_symbol(raw_symbol)
+            self.config.trading_params.symbol = symbol
+            logger.debug(f"Standardized symbol: {raw_symbol} -> {symbol}")
             
             # Ensure client is initialized
             if not self.client:
@@ -133,13 +174,17 @@ class TradingEngine:
                 raise ValueError("API client session is not initialized. Make sure to use the client within an async context manager.")
                 
             logger.debug("Client and session are properly initialized")
+            
+            # Reject a symbol the exchange does not list before loading any data
+            if not await self.client.validate_symbol(symbol):
+                raise ValueError(f"Symbol {symbol} is not listed on the exchange")
                 
             # Test API connection and initialize components
             logger.info("Testing API connection and initializing components...")
             try:
                 # Test API connection
                 await self.client.get_klines(
-                    symbol=self.config.trading_params.symbol,
+                    symbol=symbol,
                     interval=self.config.ai_config.timeframe,
                     limit=1
                 )
@@ -165,6 +210,7 @@ class TradingEngine:
             
             logger.info("Trading engine initialized successfully")
             self._running = True
+            self._initialized = True
             return True
             
         except asyncio.TimeoutError:
@@ -180,14 +226,18 @@ class TradingEngine:
             try:
                 # Check trading time window
                 if not await self.is_trading_time():
-                    logger.info("Outside trading hours, waiting...")
-                    await asyncio.sleep(60)
+                    # Sleep towards the next window instead of polling, waking every 5 minutes
+                    # to recompute it: a DST change or a config reload can move the window
+                    wait_seconds = self.seconds_until_trading_window()
+                    logger.info(f"Outside trading hours, next window opens in {wait_seconds / 60:.0f} min")
+                    await self._sleep(min(wait_seconds, 300))
                     continue
                 
-                # Rate limiting
-                current_time = time.time()
-                if current_time - self._last_signal_time < self._min_signal_interval:
-                    await asyncio.sleep(1)
+                # Rate limiting: sleep out the rest of the interval in one wait
+                current_time = time.monotonic()
+                remaining = self._last_signal_time + self._min_signal_interval - current_time
+                if remaining > 0:
+                    await self._sleep(remaining)
                     continue
                 
                 # Update price and model with timeout
@@ -196,7 +246,7 @@ class TradingEngine:
                         current_price = await self.get_current_price(self.config.trading_params.symbol)
                         if not current_price:
                             logger.warning("No current price available")
-                            await asyncio.sleep(5)
+                            await self._sleep(5)
                             continue
                         
                         logger.debug(f"Got current price: {current_price}")
@@ -236,19 +286,19 @@ class TradingEngine:
                         
                 except asyncio.TimeoutError:
                     logger.error("Timeout while fetching current price")
-                    await asyncio.sleep(5)
+                    await self._sleep(5)
                     continue
                 except Exception as e:
                     logger.error(f"Error processing signal: {str(e)}")
-                    await asyncio.sleep(5)
+                    await self._sleep(5)
                     continue
                 
                 # Sleep before next update
-                await asyncio.sleep(self.config.ai_config.update_interval)
+                await self._sleep(self.config.ai_config.update_interval)
                 
             except Exception as e:
                 logger.error(f"Error in trading loop: {str(e)}")
-                await asyncio.sleep(5)
+                await self._sleep(5)
                 
     async def _fetch_historical_data(self):
         """Fetch historical price data for initialization"""
@@ -278,11 +328,13 @@ class TradingEngine:
                     try:
                         close_price = float(kline[4])  # Close price
                         self.historical_prices.append(close_price)
-                        self.chronos.update_data(close_price)
                     except (IndexError, ValueError) as e:
                         logger.error(f"Invalid kline data format: {e}")
                         continue
                 
+                # Load the closes into the strategy in one batch
+                self.chronos.extend_data(self.historical_prices)
+                
                 if self.historical_prices:
                     return True
                 logger.error("No valid prices in historical data")
@@ -297,12 +349,6 @@ class TradingEngine:
         logger.error("Failed to fetch historical data after max retries")
         return False
         
-        logger.info("Trading engine initialized successfully")
-        self.positions: Dict[str, Dict[str, Any]] = {}
-        self.daily_order_count = 0
-        self.last_reset_date = datetime.now().date()
-        self.stop_loss_orders: Dict[str, int] = {}  # position_id -> stop_loss_order_id
-        
     async def is_trading_time(self) -> bool:
         """Check if current time is within any trading window"""
         if not self.config.trading_windows:
@@ -311,14 +357,17 @@ class TradingEngine:
         now = datetime.now()
         
         for window in self.config.trading_windows:
+            if not window.enabled:
+                continue
+            
             # Convert window timezone
-            tz = pytz.timezone(window.timezone)
+            tz = ZoneInfo(window.timezone)
             local_now = now.astimezone(tz)
             
-            # Parse time strings
-            start_time = datetime.strptime(window.start_time, "%H:%M").time()
-            end_time = datetime.strptime(window.end_time, "%H:%M").time()
-            current_time = local_now.time()
+            # Compare seconds since midnight against the pre-parsed window bounds
+            start_time = window.start_minute * 60
+            end_time = window.end_minute * 60
+            current_time = local_now.hour * 3600 + local_now.minute * 60 + local_now.second
             
             # Handle overnight windows (e.g., 22:00 to 06:00)
             if start_time <= end_time:
@@ -330,11 +379,27 @@ class TradingEngine:
         
         return False
     
+    def seconds_until_trading_window(self) -> float:
+        """Seconds until the next enabled trading window opens (0 if trading is unrestricted, a day if none is enabled)"""
+        if not self.config.trading_windows:
+            return 0.0
+        
+        now = datetime.now()
+        wait_seconds = 86400.0
+        for window in self.config.trading_windows:
+            if not window.enabled:
+                continue
+            local_now = now.astimezone(ZoneInfo(window.timezone))
+            current_time = local_now.hour * 3600 + local_now.minute * 60 + local_now.second + local_now.microsecond / 1e6
+            wait_seconds = min(wait_seconds, (window.start_minute * 60 - current_time) % 86400)
+        return wait_seconds
+    
     def _reset_daily_counters(self):
         """Reset daily counters if new day"""
         today = datetime.now().date()
         if today != self.last_reset_date:
             self.daily_order_count = 0
+            self.daily_trades = 0
             self.last_reset_date = today
             logger.info("Daily counters reset")
     
@@ -345,13 +410,14 @@ class TradingEngine:
     
     def _calculate_order_quantity(self, price: float, usdt_amount: Optional[float] = None) -> float:
         """Calculate order quantity based on USDT amount or configured quantity"""
-        if self.config.trading_params.quantity_is_usdt:
+        trading_params = self.config.trading_params
+        if trading_params.quantity_is_usdt:
             # Calculate quantity from USDT amount
-            usdt_value = usdt_amount or self.config.trading_params.quantity
+            usdt_value = usdt_amount or trading_params.quantity
             return usdt_value / price
         else:
             # Use direct quantity (base currency amount)
-            return usdt_amount or self.config.trading_params.quantity
+            return usdt_amount or trading_params.quantity
     
     def _get_available_balance(self, account_info: Dict[str, Any], asset: str) -> float:
         """Get available balance for a specific asset from account info"""
@@ -407,7 +473,7 @@ class TradingEngine:
             logger.debug(f"Fetching current price for {symbol}")
             
             ticker = await self.client.get_ticker_price(symbol)
-            logger.debug(f"Received ticker response: {ticker}")
+            logger.debug("Received ticker response: {}", ticker)
             
             current_price = float(ticker.get('price', 0))
             logger.debug(f"Parsed current price: {current_price}")
@@ -473,28 +539,38 @@ class TradingEngine:
             logger.error(f"Error executing trade for signal {signal}: {e}")
             
     async def _check_daily_reset(self):
-        """Reset daily trade counter at UTC midnight"""
-        now = datetime.now()
-        if now.hour == 0 and now.minute == 0:
-            self.daily_trades = 0
+        """Reset daily trade counters once the date has rolled over"""
+        self._reset_daily_counters()
     
     async def start(self):
         """Start the trading engine"""
         self._running = True
+        self._stop_event.clear()
         while self._running:
             try:
                 if await self.is_trading_time():
                     await self.update_strategy()
-                await asyncio.sleep(self.config.ai_config.update_interval)
+                await self._sleep(self.config.ai_config.update_interval)
             except Exception as e:
                 logger.error(f"Error in trading loop: {e}")
-                await asyncio.sleep(5)  # Back off on error
+                await self._sleep(5)  # Back off on error
                 
     async def stop(self):
-        """Stop the trading engine"""
+        """Stop the trading engine (a later initialize() starts from scratch)"""
         self._running = False
+        self._initialized = False
         self._stop_event.set()
     
+    async def _sleep(self, seconds: float) -> bool:
+        """Sleep for up to `seconds`, returning early (True) as soon as stop() is called"""
+        if self._stop_event.is_set():
+            return True
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
     async def place_limit_buy_order(self, price: float, quantity: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """Place a limit buy order with automatic stop loss using MEXC's integrated approach"""
         if not await self.is_trading_time():
@@ -716,7 +792,7 @@ class TradingEngine:
             logger.warning("positions attribute not found, initializing empty dictionary")
             self.positions = {}
         
-        while True:
+        while not self._stop_event.is_set():
             try:
                 positions_to_check = list(self.positions.items())
                 
@@ -738,12 +814,14 @@ class TradingEngine:
                     except Exception as e:
                         logger.error(f"Error checking position {position_id}: {str(e)}")
                 
-                # Wait before next check (adjust?)
-                await asyncio.sleep(0.1)  # Check every 0.1 seconds for faster stop loss execution
+                # Wait before next check; stop() wakes the wait immediately
+                await self._sleep(0.1)  # Check every 0.1 seconds for faster stop loss execution
                 
             except Exception as e:
                 logger.error(f"Error in position monitoring loop: {str(e)}")
-                await asyncio.sleep(1)  # Wait longer on error (?)
+                await self._sleep(1)  # Wait longer on error (?)
+        
+        logger.info("Position monitoring stopped")
     
     async def _check_position_status(self, position_id: str, position_data: Dict[str, Any]):
         """Check status of a specific position and handle stop-loss triggers"""
@@ -916,9 +994,13 @@ class TradingEngine:
     async def get_account_summary(self) -> Dict[str, Any]:
         """Get trading account summary"""
         try:
-            account_info = await self.client.get_account_info()
-            open_orders = await self.client.get_open_orders()
-            current_price = await self.get_current_price(self.config.trading_params.symbol)
+            # Independent requests: issue them together so latency is the slowest one, not the sum
+            account_info, open_orders, current_price, trading_time_active = await asyncio.gather(
+                self.client.get_account_info(),
+                self.client.get_open_orders(),
+                self.get_current_price(self.config.trading_params.symbol),
+                self.is_trading_time()
+            )
             
             return {
                 "account_balance": account_info.get('balances', []),
@@ -927,7 +1009,7 @@ class TradingEngine:
                 "daily_orders_used": self.daily_order_count,
                 "daily_orders_remaining": self.config.trading_params.max_orders_per_day - self.daily_order_count,
                 "current_price": current_price,
-                "trading_time_active": await self.is_trading_time(),
+                "trading_time_active": trading_time_active,
                 "quantity_mode": "USDT-based" if self.config.trading_params.quantity_is_usdt else "Base currency",
                 "configured_quantity": self.config.trading_params.quantity
             }
@@ -959,12 +1041,17 @@ class TradingEngine:
             logger.info(f"Auto-calculated quantity: {quantity} (from ${usable_balance:.2f} USDT)")
         
         if self.config.dry_run:
-            logger.info("DRY RUN: Would place bracket buy order")
-            logger.info(f"  Symbol: {symbol}")
-            logger.info(f"  Entry Price: ${price}")
-            logger.info(f"  Quantity: {quantity}")
-            logger.info(f"  Stop Loss: {stop_loss_percentage}% (${price * (1 - stop_loss_percentage/100):.4f})")
-            logger.info(f"  Take Profit: {take_profit_percentage}% (${price * (1 + take_profit_percentage/100):.4f})")
+            # Exact, tick-aligned prices (float math with .4f loses low-priced pairs)
+            tick = _price_tick(await self.client.get_symbol_info(symbol))
+            stop_loss_price, take_profit_price = _bracket_prices(price, stop_loss_percentage, take_profit_percentage, tick)
+            logger.info(
+                "DRY RUN: Would place bracket buy order\n"
+                f"  Symbol: {symbol}\n"
+                f"  Entry Price: ${price}\n"
+                f"  Quantity: {quantity}\n"
+                f"  Stop Loss: {stop_loss_percentage}% (${stop_loss_price})\n"
+                f"  Take Profit: {take_profit_percentage}% (${take_profit_price})"
+            )
             return {
                 'dry_run': True,
                 'symbol': symbol,
@@ -972,7 +1059,9 @@ class TradingEngine:
                 'quantity': quantity,
                 'price': price,
                 'stop_loss_percentage': stop_loss_percentage,
-                'take_profit_percentage': take_profit_percentage
+                'take_profit_percentage': take_profit_percentage,
+                'stop_loss_price': stop_loss_price,
+                'take_profit_price': take_profit_price
             }
         
         try:
@@ -986,11 +1075,13 @@ class TradingEngine:
                 take_profit_percentage=take_profit_percentage
             )
             
-            logger.info(f"Bracket buy order placed successfully:")
-            logger.info(f"  Order ID: {result['main_order'].get('orderId', 'Unknown')}")
-            logger.info(f"  Bracket Type: {result['bracket_type']}")
-            logger.info(f"  Stop Loss: ${result['stop_loss_price']:.4f}")
-            logger.info(f"  Take Profit: ${result['take_profit_price']:.4f}")
+            logger.info(
+                "Bracket buy order placed successfully:\n"
+                f"  Order ID: {result['main_order'].get('orderId', 'Unknown')}\n"
+                f"  Bracket Type: {result['bracket_type']}\n"
+                f"  Stop Loss: ${result['stop_loss_price']:.4f}\n"
+                f"  Take Profit: ${result['take_profit_price']:.4f}"
+            )
             
             # Store position for monitoring if needed
             if result['bracket_type'] == 'software':
@@ -1164,6 +1255,16 @@ class TradingEngine:
             quantity: Amount to buy (if None, uses configured amount)
         """
         
+        # Validate prices first so bad input fails before any other checks
+        if entry_price <= 0:
+            raise ValueError(f"Entry price ({entry_price}) must be positive")
+        
+        if stop_loss_price >= entry_price:
+            raise ValueError(f"Stop loss price ({stop_loss_price}) must be below entry price ({entry_price}) for buy orders")
+        
+        if take_profit_price <= entry_price:
+            raise ValueError(f"Take profit price ({take_profit_price}) must be above entry price ({entry_price}) for buy orders")
+        
         if not await self.is_trading_time():
             logger.warning("Outside trading hours, skipping sequential bracket order")
             return None
@@ -1182,21 +1283,17 @@ class TradingEngine:
         
         # Round to appropriate precision
         order_quantity = round(order_quantity, 6)
-        
-        # Validate prices
-        if stop_loss_price >= entry_price:
-            raise ValueError(f"Stop loss price ({stop_loss_price}) must be below entry price ({entry_price}) for buy orders")
-        
-        if take_profit_price <= entry_price:
-            raise ValueError(f"Take profit price ({take_profit_price}) must be above entry price ({entry_price}) for buy orders")
+        total_cost, max_loss, max_profit, rr_ratio = _bracket_stats(entry_price, stop_loss_price, take_profit_price, order_quantity)
         
         try:
             if self.config.dry_run:
-                usdt_value = order_quantity * entry_price
-                logger.info(f"DRY RUN: Sequential bracket order for {symbol}")
-                logger.info(f"  1. BUY {order_quantity} @ ${entry_price} (${usdt_value:.2f} USDT)")
-                logger.info(f"  2. After fill, place STOP_LOSS @ ${stop_loss_price}")
-                logger.info(f"  3. After fill, place TAKE_PROFIT @ ${take_profit_price}")
+                logger.info(
+                    f"DRY RUN: Sequential bracket order for {symbol}\n"
+                    f"  1. BUY {order_quantity} @ ${entry_price} (${total_cost:.2f} USDT)\n"
+                    f"  2. After fill, place STOP_LOSS @ ${stop_loss_price}\n"
+                    f"  3. After fill, place TAKE_PROFIT @ ${take_profit_price}\n"
+                    f"  Max loss: ${max_loss:.2f} | Max profit: ${max_profit:.2f} | R:R 1:{rr_ratio:.2f}"
+                )
                 
                 # Simulate the order structure
                 fake_order_id = f"dry_run_seq_{int(time.time())}"
@@ -1220,12 +1317,15 @@ class TradingEngine:
                 take_profit_price=take_profit_price
             )
             
-            logger.info(f"Sequential bracket order initiated:")
-            logger.info(f"  Main order ID: {result['main_order'].get('orderId', 'Unknown')}")
-            logger.info(f"  Entry price: ${entry_price}")
-            logger.info(f"  Stop loss: ${stop_loss_price}")
-            logger.info(f"  Take profit: ${take_profit_price}")
-            logger.info(f"  Quantity: {order_quantity}")
+            logger.info(
+                f"Sequential bracket order initiated:\n"
+                f"  Main order ID: {result['main_order'].get('orderId', 'Unknown')}\n"
+                f"  Entry price: ${entry_price}\n"
+                f"  Stop loss: ${stop_loss_price}\n"
+                f"  Take profit: ${take_profit_price}\n"
+                f"  Quantity: {order_quantity} (${total_cost:.2f} USDT)\n"
+                f"  Max loss: ${max_loss:.2f} | Max profit: ${max_profit:.2f} | R:R 1:{rr_ratio:.2f}"
+            )
             
             self.daily_order_count += 1
             
@@ -1522,6 +1622,16 @@ class TradingEngine:
             quantity: Amount to buy (if None, uses configured amount)
         """
         
+        # Validate prices first so bad input fails before any other checks
+        if entry_price <= 0:
+            raise ValueError(f"Entry price ({entry_price}) must be positive")
+        
+        if stop_loss_price >= entry_price:
+            raise ValueError(f"Stop loss price ({stop_loss_price}) must be below entry price ({entry_price}) for buy orders")
+        
+        if take_profit_price <= entry_price:
+            raise ValueError(f"Take profit price ({take_profit_price}) must be above entry price ({entry_price}) for buy orders")
+        
         if not await self.is_trading_time():
             logger.warning("Outside trading hours, skipping bracket order")
             return None
@@ -1540,22 +1650,18 @@ class TradingEngine:
         
         # Round to appropriate precision
         order_quantity = round(order_quantity, 6)
-        
-        # Validate prices
-        if stop_loss_price >= entry_price:
-            raise ValueError(f"Stop loss price ({stop_loss_price}) must be below entry price ({entry_price}) for buy orders")
-        
-        if take_profit_price <= entry_price:
-            raise ValueError(f"Take profit price ({take_profit_price}) must be above entry price ({entry_price}) for buy orders")
+        total_cost, max_loss, max_profit, rr_ratio = _bracket_stats(entry_price, stop_loss_price, take_profit_price, order_quantity)
         
         try:
             if self.config.dry_run:
-                usdt_value = order_quantity * entry_price
-                logger.info(f"DRY RUN: Simple bracket order for {symbol}")
-                logger.info(f"  BUY {order_quantity} @ ${entry_price} (${usdt_value:.2f} USDT)")
-                logger.info(f"  Stop Loss: ${stop_loss_price}")
-                logger.info(f"  Take Profit: ${take_profit_price}")
-                logger.info("  All SL/TP handled by MEXC exchange automatically")
+                logger.info(
+                    f"DRY RUN: Simple bracket order for {symbol}\n"
+                    f"  BUY {order_quantity} @ ${entry_price} (${total_cost:.2f} USDT)\n"
+                    f"  Stop Loss: ${stop_loss_price}\n"
+                    f"  Take Profit: ${take_profit_price}\n"
+                    f"  Max loss: ${max_loss:.2f} | Max profit: ${max_profit:.2f} | R:R 1:{rr_ratio:.2f}\n"
+                    "  All SL/TP handled by MEXC exchange automatically"
+                )
                 
                 return {
                     "bracket_type": "dry_run_native",
@@ -1576,13 +1682,16 @@ class TradingEngine:
                 take_profit_price=take_profit_price
             )
             
-            logger.info(f"   Native bracket order placed successfully!")
-            logger.info(f"  Bracket Type: {result['bracket_type']}")
-            logger.info(f"  Entry Price: ${entry_price}")
-            logger.info(f"  Stop Loss: ${stop_loss_price}")
-            logger.info(f"  Take Profit: ${take_profit_price}")
-            logger.info(f"  Quantity: {order_quantity}")
-            logger.info("    MEXC will handle all SL/TP execution automatically")
+            logger.info(
+                "   Native bracket order placed successfully!\n"
+                f"  Bracket Type: {result['bracket_type']}\n"
+                f"  Entry Price: ${entry_price}\n"
+                f"  Stop Loss: ${stop_loss_price}\n"
+                f"  Take Profit: ${take_profit_price}\n"
+                f"  Quantity: {order_quantity} (${total_cost:.2f} USDT)\n"
+                f"  Max loss: ${max_loss:.2f} | Max profit: ${max_profit:.2f} | R:R 1:{rr_ratio:.2f}\n"
+                "    MEXC will handle all SL/TP execution automatically"
+            )
             
             self.daily_order_count += 1
             return result